@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from .. import __version__
 from ..runtime_paths import resolve_runtime_paths
 from ..utils.connection_utils import get_connection_target
+from ..utils.yaml_io import safe_load
 
 logger = logging.getLogger(__name__)
 
@@ -627,7 +628,7 @@ def main() -> None:
             # Merge into existing instead of replacing when importing a subset.
             try:
                 with open(output_path, "r", encoding="utf-8") as f:
-                    existing_connections = yaml.safe_load(f) or []
+                    existing_connections = safe_load(f) or []
             except Exception as e:
                 existing_connections = []
                 print(f"\n⚠ Could not read existing {output_path} for merge: {e}")
@@ -696,7 +697,7 @@ def main() -> None:
             if output_path.exists():
                 try:
                     with open(output_path, "r", encoding="utf-8") as f:
-                        existing = yaml.safe_load(f) or []
+                        existing = safe_load(f) or []
                 except Exception as e:
                     existing = []
                     print(f"\nDry run: could not read {output_path}: {e}")
@@ -3,8 +3,7 @@
 from pathlib import Path
 from typing import Any, Dict, cast
 
-import yaml
-
+from ..utils.yaml_io import safe_load
 from .connection import Connection
 
 
@@ -60,7 +59,7 @@ def load_connections_from_text(
         yaml_text: Raw YAML document content
         source: Source label used in validation errors
     """
-    raw_configs = yaml.safe_load(yaml_text)
+    raw_configs = safe_load(yaml_text)
     return _build_connections_from_raw_configs(raw_configs, source)
 
 
@@ -4,6 +4,8 @@ from typing import Any, Dict, List
 
 import yaml
 
+from ..utils.yaml_io import safe_load
+
 
 class ConfigParser:
     def __init__(self, config_path: str | Path):
@@ -15,7 +17,7 @@ class ConfigParser:
             return []
 
         with open(self.config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or []
+            config = safe_load(f) or []
 
         # Process each connection
         processed_config = []
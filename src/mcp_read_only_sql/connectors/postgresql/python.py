@@ -158,10 +158,10 @@ class PostgreSQLPythonConnector(BaseConnector):
                         values = (
                             [row.get(col) for col in columns]
                             if columns
-                            else list(row.values())
+                            else row.values()
                         )
                     else:
-                        values = list(row)
+                        values = row
                     lines.append(format_tsv_line(values))
 
             return "\n".join(lines)
@@ -220,10 +220,10 @@ class PostgreSQLPythonConnector(BaseConnector):
                             values = (
                                 [row.get(col) for col in columns]
                                 if columns
-                                else list(row.values())
+                                else row.values()
                             )
                         else:
-                            values = list(row)
+                            values = row
                         wrote_content = write_tsv_text_line(
                             handle, format_tsv_line(values), wrote_content
                         )
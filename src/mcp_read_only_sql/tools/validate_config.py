@@ -5,11 +5,10 @@ import sys
 from pathlib import Path
 from typing import Any, List
 
-import yaml
-
 from .. import __version__
 from ..config.parser import ConfigParser
 from ..runtime_paths import resolve_runtime_paths
+from ..utils.yaml_io import safe_load
 
 
 def find_legacy_credential_errors(raw_config: List[Any]) -> List[str]:
@@ -95,7 +94,7 @@ def validate_config(
 
     try:
         with open(config_path, encoding="utf-8") as raw_file:
-            raw_configs = yaml.safe_load(raw_file) or []
+            raw_configs = safe_load(raw_file) or []
 
         if not isinstance(raw_configs, list):
             print("❌ Configuration file must contain a list of connections")
@@ -4,6 +4,12 @@ Utilities for handling database connections
 
 from typing import Dict, Any
 
+# Server hosts that mean "the database runs on the SSH host itself"
+_LOCALHOST_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+# Default server port per database type (ClickHouse uses the HTTP port)
+_DEFAULT_PORTS = {"postgresql": 5432, "clickhouse": 8123}
+
 
 def get_connection_target(config: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -29,6 +35,7 @@ def get_connection_target(config: Dict[str, Any]) -> Dict[str, Any]:
             database = ""
     ssh_config = config.get("ssh_tunnel")
     servers = config.get("servers", [])
+    default_port = _DEFAULT_PORTS.get(db_type, 8123)
 
     # Get first server if available
     if servers:
@@ -39,7 +46,7 @@ def get_connection_target(config: Dict[str, Any]) -> Dict[str, Any]:
             if "host" not in server:
                 raise ValueError("Server configuration missing required field 'host'")
             db_host = server["host"]
-            db_port = server.get("port", 5432 if db_type == "postgresql" else 8123)
+            db_port = server.get("port", default_port)
         elif isinstance(server, str):
             # Parse "host:port" string
             if ":" in server:
@@ -47,13 +54,13 @@ def get_connection_target(config: Dict[str, Any]) -> Dict[str, Any]:
                 db_port = int(port_str)
             else:
                 db_host = server
-                db_port = 5432 if db_type == "postgresql" else 8123
+                db_port = default_port
         else:
             db_host = "localhost"
-            db_port = 5432 if db_type == "postgresql" else 8123
+            db_port = default_port
     else:
         db_host = "localhost"
-        db_port = 5432 if db_type == "postgresql" else 8123
+        db_port = default_port
 
     # Determine connection type and final target
     if ssh_config:
@@ -62,7 +69,7 @@ def get_connection_target(config: Dict[str, Any]) -> Dict[str, Any]:
             raise ValueError("SSH tunnel configuration missing required field 'host'")
         ssh_host = ssh_config["host"]
 
-        if db_host in ["localhost", "127.0.0.1"]:
+        if db_host in _LOCALHOST_HOSTS:
             # SSH tunnel where DB is on the SSH host itself
             return {
                 "host": ssh_host,
@@ -2,7 +2,11 @@
 
 import csv
 import io
-from typing import Any, List, TextIO
+import re
+from typing import Any, Iterable, List, TextIO
+
+# Fields containing any of these characters go through csv.writer for quoting.
+_NEEDS_QUOTING = re.compile(r'[\t\n\r"]').search
 
 
 def format_as_tsv(rows: List[Any], columns: List[str]) -> str:
@@ -27,32 +31,44 @@ def format_as_tsv(rows: List[Any], columns: List[str]) -> str:
     if columns:
         writer.writerow([str(col) for col in columns])
 
-    for row in rows:
-        if isinstance(row, dict):
-            if columns:
-                values = [row.get(col, "") for col in columns]
-            else:
-                values = list(row.values())
-        elif isinstance(row, (list, tuple)):
-            values = list(row)
-        else:
-            values = [row]
-
-        normalized = ["" if value is None else str(value) for value in values]
-        writer.writerow(normalized)
+    writer.writerows(
+        ["" if value is None else str(value) for value in _row_values(row, columns)]
+        for row in rows
+    )
 
     return buffer.getvalue().rstrip("\n")
 
 
-def format_tsv_line(values: List[Any]) -> str:
-    """Render a single TSV line (without trailing newline)."""
+def _row_values(row: Any, columns: List[str]) -> Iterable[Any]:
+    """Return the cell values of one row (dict, list, tuple, or scalar)."""
+    if isinstance(row, dict):
+        if columns:
+            return [row.get(col, "") for col in columns]
+        return row.values()
+    if isinstance(row, (list, tuple)):
+        return row
+    return (row,)
+
+
+def format_tsv_line(values: Iterable[Any]) -> str:
+    """Render a single TSV line (without trailing newline).
+
+    ``values`` may be any iterable, e.g. a row tuple or ``dict.values()``.
+    """
+    parts = ["" if value is None else str(value) for value in values]
+    if parts == [""] or any(map(_NEEDS_QUOTING, parts)):
+        return _format_tsv_line_csv(parts)
+    return "\t".join(parts)
+
+
+def _format_tsv_line_csv(parts: List[str]) -> str:
+    """Render a TSV line through csv.writer for fields that need quoting."""
 
     buffer = io.StringIO()
     writer = csv.writer(
         buffer, delimiter="\t", lineterminator="", quoting=csv.QUOTE_MINIMAL
     )
-    normalized = ["" if value is None else str(value) for value in values]
-    writer.writerow(normalized)
+    writer.writerow(parts)
     return buffer.getvalue()
 
 
@@ -0,0 +1,15 @@
+"""
+YAML loading helpers shared by the config loader and CLI tools.
+"""
+
+from typing import IO, Any
+
+import yaml
+
+# libyaml-backed safe loader when PyYAML was built with it, else pure Python.
+SafeYamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load(stream: str | IO[str]) -> Any:
+    """Parse a YAML document with the fastest available safe loader."""
+    return yaml.load(stream, Loader=SafeYamlLoader)
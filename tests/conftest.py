@@ -4,10 +4,12 @@ Shared test fixtures for MCP SQL Server tests
 Uses the minimal_client.py pattern for real MCP protocol testing
 """
 
+import asyncio
+import math
 import os
 import subprocess
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 import pytest
 from mcp import ClientSession, StdioServerParameters
@@ -15,12 +17,19 @@ from mcp.client.stdio import stdio_client
 
 from mcp_read_only_sql.config import Connection
 from mcp_read_only_sql.connectors.base import BaseConnector
+from mcp_read_only_sql.connectors.clickhouse.cli import ClickHouseCLIConnector
+from mcp_read_only_sql.connectors.clickhouse.python import ClickHousePythonConnector
+from mcp_read_only_sql.connectors.postgresql.cli import PostgreSQLCLIConnector
+from mcp_read_only_sql.connectors.postgresql.python import PostgreSQLPythonConnector
 from tests.docker_test_config import (
+    docker_test_private_ssh_config,
     docker_test_server,
     docker_test_server_string,
 )
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# Fixtures never mutate os.environ, so one snapshot serves every spawned server
+_BASE_ENV = dict(os.environ)
 
 
 # Helper function to create Connection objects from dict configs
@@ -56,6 +65,103 @@ def make_recording_connector(config_dict: Dict[str, Any]) -> RecordingConnector:
     return RecordingConnector(make_connection(config_dict))
 
 
+CONNECTOR_CLASSES: Dict[Tuple[str, str], type] = {
+    ("postgresql", "python"): PostgreSQLPythonConnector,
+    ("postgresql", "cli"): PostgreSQLCLIConnector,
+    ("clickhouse", "python"): ClickHousePythonConnector,
+    ("clickhouse", "cli"): ClickHouseCLIConnector,
+}
+
+
+def build_connector(db_type: str, implementation: str, **overrides):
+    """Construct a connector for the given database/implementation pair."""
+    servers = overrides.pop(
+        "servers",
+        [
+            (
+                docker_test_server(
+                    db_type,
+                    port=overrides.pop("port", None),
+                )
+                if "host" not in overrides
+                else {
+                    "host": overrides.pop("host"),
+                    "port": overrides.pop("port", docker_test_server(db_type)["port"]),
+                }
+            )
+        ],
+    )
+    connection_name = overrides.pop(
+        "connection_name", f"test_{db_type}_{implementation}"
+    )
+    config = {
+        "connection_name": connection_name,
+        "type": db_type,
+        "implementation": implementation,
+        "servers": servers,
+        "db": overrides.pop("db", "testdb"),
+        "username": overrides.pop("username", "testuser"),
+        "password": overrides.pop("password", "testpass"),
+    }
+    config.update(overrides)
+
+    hard_timeout_override = config.pop("hard_timeout", None)
+    connection = make_connection(config)
+    connector = CONNECTOR_CLASSES[(db_type, implementation)](connection)
+
+    if hard_timeout_override is not None:
+        connector.hard_timeout = hard_timeout_override
+
+    return connector
+
+
+PG_SSH_CONFIG = docker_test_private_ssh_config("pg_cli_ssh")
+
+
+@pytest.fixture(scope="class")
+def pg_ssh_connector():
+    """PostgreSQL CLI connector behind the key-authenticated tunnel, shared per class"""
+    return PostgreSQLCLIConnector(make_connection(PG_SSH_CONFIG))
+
+
+async def run_concurrently(connector: BaseConnector, queries: List[str]) -> List[str]:
+    """Run ``queries`` concurrently, raising the first failure once all finish.
+
+    Letting every query finish keeps failing tests from leaving ssh/psql
+    subprocesses running past the event loop.
+    """
+    results = await asyncio.gather(
+        *(connector.execute_query(query) for query in queries),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def stdio_server_params(config_file: str) -> StdioServerParameters:
+    """Parameters for spawning the MCP server against ``config_file``'s directory.
+
+    The parent environment, snapshotted once at import, is passed through
+    as-is; fixtures never mutate ``os.environ`` to configure the server.
+    """
+    return StdioServerParameters(
+        command="uv",
+        args=[
+            "--directory",
+            str(PROJECT_ROOT),
+            "run",
+            "python",
+            "-m",
+            "mcp_read_only_sql.server",
+            "--config-dir",
+            str(Path(config_file).parent),
+        ],
+        env=_BASE_ENV,
+    )
+
+
 # Common test config fixtures - return Connection objects
 @pytest.fixture
 def postgres_config():
@@ -94,8 +200,8 @@ def anyio_backend():
     return "asyncio"
 
 
-@pytest.fixture
-def test_config_file(tmp_path):
+@pytest.fixture(scope="session")
+def test_config_file(tmp_path_factory):
     """Create a test configuration file"""
     config_content = """
 - connection_name: test_connection
@@ -108,31 +214,21 @@ def test_config_file(tmp_path):
   username: testuser
   password: testpass
 """
-    config_file = tmp_path / "connections.yaml"
+    config_file = tmp_path_factory.mktemp("mcp_client") / "connections.yaml"
     config_file.write_text(config_content)
     return str(config_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def mcp_client(test_config_file):
     """
     Connect to MCP server using real MCP protocol over stdio.
     This follows the minimal_client.py pattern.
+
+    The server is read-only and keeps no per-request state, so one server
+    process is shared by the whole session instead of spawning one per test.
     """
-    server_params = StdioServerParameters(
-        command="uv",
-        args=[
-            "--directory",
-            str(PROJECT_ROOT),
-            "run",
-            "python",
-            "-m",
-            "mcp_read_only_sql.server",
-            "--config-dir",
-            str(Path(test_config_file).parent),
-        ],
-        env=dict(os.environ),
-    )
+    server_params = stdio_server_params(test_config_file)
 
     # Use the pattern from minimal_client.py exactly
     async with stdio_client(server_params) as (read, write):
@@ -143,36 +239,42 @@ async def mcp_client(test_config_file):
 
 # Docker-based fixtures for integration tests
 @pytest.fixture(scope="session")
-def docker_check():
-    """Check if Docker containers are running"""
+def running_containers() -> frozenset[str]:
+    """Names of the running Docker containers, listed once per session."""
     result = subprocess.run(
-        ["docker", "ps", "--format", "table {{.Names}}"], capture_output=True, text=True
+        ["docker", "ps", "--format", "{{.Names}}"],
+        capture_output=True,
+        text=True,
+        check=False,
     )
-    running_containers = result.stdout
+    return frozenset(line.strip() for line in result.stdout.splitlines() if line)
 
-    if (
-        "mcp-postgres" not in running_containers
-        or "mcp-clickhouse" not in running_containers
+
+def _has_container(running_containers: frozenset[str], prefix: str) -> bool:
+    """Match compose container names such as ``mcp-postgres-test`` by prefix."""
+    return any(name.startswith(prefix) for name in running_containers)
+
+
+@pytest.fixture(scope="session")
+def docker_check(running_containers):
+    """Check if Docker containers are running"""
+    if not _has_container(running_containers, "mcp-postgres") or not _has_container(
+        running_containers, "mcp-clickhouse"
     ):
         pytest.skip("Docker containers not running. Run: just docker-test-setup")
 
 
 @pytest.fixture(scope="session")
-def ssh_container_check():
+def ssh_container_check(running_containers):
     """Check if SSH bastion container is running"""
-    result = subprocess.run(
-        ["docker", "ps", "--format", "{{.Names}}"], capture_output=True, text=True
-    )
-    running_containers = result.stdout
-
-    if "mcp-ssh-bastion" not in running_containers:
+    if not _has_container(running_containers, "mcp-ssh-bastion"):
         pytest.skip(
             "SSH bastion container not running. Run: docker-compose --profile test up -d"
         )
 
 
-@pytest.fixture
-def integration_config_file(tmp_path):
+@pytest.fixture(scope="session")
+def integration_config_file(tmp_path_factory):
     """Create integration test configuration with real databases"""
     config_content = f"""
 # Integration test configuration
@@ -225,28 +327,15 @@ def integration_config_file(tmp_path):
   query_timeout: 2
 """
 
-    config_file = tmp_path / "connections.yaml"
+    config_file = tmp_path_factory.mktemp("integration") / "connections.yaml"
     config_file.write_text(config_content)
     return str(config_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def integration_client(integration_config_file, docker_check):
-    """Client connected to integration test server"""
-    server_params = StdioServerParameters(
-        command="uv",
-        args=[
-            "--directory",
-            str(PROJECT_ROOT),
-            "run",
-            "python",
-            "-m",
-            "mcp_read_only_sql.server",
-            "--config-dir",
-            str(Path(integration_config_file).parent),
-        ],
-        env=dict(os.environ),
-    )
+    """Client connected to integration test server, shared by the session"""
+    server_params = stdio_server_params(integration_config_file)
 
     async with stdio_client(server_params) as (read, write):
         async with ClientSession(read, write) as session:
@@ -255,6 +344,123 @@ async def integration_client(integration_config_file, docker_check):
 
 
 # Helper functions for tests
+def _split_tsv(text: str) -> tuple[list[str], list[list[str]]]:
+    """Split a TSV payload into its header and non-empty data rows."""
+    header, *lines = text.strip().split("\n")
+    return header.split("\t"), [line.split("\t") for line in lines if line]
+
+
+def first_data_cell(tsv: str) -> str:
+    """Return the first cell of the first data row without splitting the payload."""
+    start = tsv.find("\n") + 1
+    assert 0 < start < len(tsv), f"TSV output has no data row: {tsv!r}"
+    end = tsv.find("\n", start)
+    if end == -1:
+        end = len(tsv)
+    tab = tsv.find("\t", start, end)
+    return tsv[start : end if tab == -1 else tab]
+
+
+def tsv_line_count(tsv: str) -> int:
+    """Count the lines (header included) of a TSV payload."""
+    return tsv.rstrip("\n").count("\n") + 1
+
+
+class DummyStdout:
+    """Subprocess stdout stand-in yielding canned lines, optionally slowly.
+
+    A ``delay`` of ``math.inf`` makes every read hang until cancelled.
+    """
+
+    def __init__(self, lines, delay: float = 0):
+        self._buf = b"".join(line.encode() + b"\n" for line in lines)
+        self._pos = 0
+        self._delay = delay
+
+    async def readline(self):
+        if self._delay == math.inf:
+            # Suspend on a future that never resolves; no timer is scheduled
+            await asyncio.get_running_loop().create_future()
+        elif self._delay:
+            await asyncio.sleep(self._delay)
+        end = self._buf.find(b"\n", self._pos)
+        end = len(self._buf) if end == -1 else end + 1
+        line = self._buf[self._pos : end]
+        self._pos = end
+        return line
+
+
+class DummyStderr:
+    def __init__(self, data=b""):
+        self._data = data
+        self._read = False
+
+    async def read(self):
+        if self._read:
+            return b""
+        self._read = True
+        return self._data
+
+
+class DummyStdin:
+    def __init__(self):
+        self.writes = []
+        self.closed = False
+
+    def write(self, data):
+        self.writes.append(data)
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class DummyProcess:
+    """Minimal ``asyncio.subprocess.Process`` replacement for CLI connector tests."""
+
+    def __init__(self, lines, returncode=0, stderr=b"", delay: float = 0):
+        self.stdin = DummyStdin()
+        self.stdout = DummyStdout(lines, delay)
+        self.stderr = DummyStderr(stderr)
+        self.returncode = returncode
+        self.kill_count = 0
+
+    def kill(self):
+        self.kill_count += 1
+
+    async def wait(self):
+        return self.returncode
+
+
+@pytest.fixture
+def fake_subprocess(monkeypatch):
+    """Install scripted ``asyncio.create_subprocess_exec`` responses.
+
+    Each call consumes the next response (the last one repeats); exceptions
+    are raised and anything else is returned as the process. Returns the list
+    of environments the subprocess was spawned with.
+    """
+
+    def install(responses):
+        calls = []
+
+        async def fake_create_subprocess_exec(*cmd, env=None, **kwargs):
+            calls.append(env.copy() if env else {})
+            response = responses[min(len(calls), len(responses)) - 1]
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr(
+            asyncio, "create_subprocess_exec", fake_create_subprocess_exec
+        )
+        return calls
+
+    return install
+
+
 async def call_tool(
     session: ClientSession, tool_name: str, arguments: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -290,13 +496,8 @@ async def call_tool(
             output_path = Path(text_content)
             if output_path.exists():
                 file_content = output_path.read_text(encoding="utf-8")
-                lines = file_content.strip().split("\n") if file_content else []
-                if lines:
-                    columns = lines[0].split("\t")
-                    rows = []
-                    for line in lines[1:]:
-                        if line:
-                            rows.append(line.split("\t"))
+                if file_content:
+                    columns, rows = _split_tsv(file_content)
                     return {
                         "success": True,
                         "file_path": text_content,
@@ -312,38 +513,17 @@ async def call_tool(
 
         # For list_connections, parse TSV format
         if tool_name == "list_connections":
-            lines = text_content.strip().split("\n")
-            if lines:
-                # First line is headers
-                headers = lines[0].split("\t")
-                connections = []
-                for line in lines[1:]:
-                    if line:  # Skip empty lines
-                        values = line.split("\t")
-                        conn = {}
-                        for i, header in enumerate(headers):
-                            if i < len(values):
-                                conn[header] = values[i]
-                        connections.append(conn)
-                return connections
-            return []
+            headers, rows = _split_tsv(text_content)
+            return [dict(zip(headers, values)) for values in rows]
 
         # For queries, parse TSV response
-        lines = text_content.strip().split("\n")
-        if lines:
-            # First line is headers
-            columns = lines[0].split("\t")
-            rows = []
-            for line in lines[1:]:
-                if line:  # Skip empty lines
-                    rows.append(line.split("\t"))
-            return {
-                "success": True,
-                "columns": columns,
-                "rows": rows,
-                "rowCount": len(rows),
-            }
-        return {"success": True, "data": text_content}
+        columns, rows = _split_tsv(text_content)
+        return {
+            "success": True,
+            "columns": columns,
+            "rows": rows,
+            "rowCount": len(rows),
+        }
 
     return {"success": False, "error": "No result returned"}
 
@@ -12,6 +12,11 @@ _DEFAULT_PORTS = {
     "clickhouse": 9000,
 }
 _DEFAULT_SSH_PORT = 2222
+# Databases on the Docker network that are only reachable through the SSH host.
+_PRIVATE_SERVERS = {
+    "postgresql": {"host": "mcp-postgres-private", "port": 5432},
+    "clickhouse": {"host": "mcp-clickhouse-private", "port": 9000},
+}
 
 
 def docker_test_host() -> str:
@@ -82,6 +87,22 @@ def docker_test_ssh_tunnel(
     return config
 
 
+def docker_test_private_ssh_config(
+    name: str, db_type: str = "postgresql", **overrides: Any
+) -> Dict[str, Any]:
+    """Build a config for a private Docker database reached through the key tunnel."""
+    return {
+        "connection_name": name,
+        "type": db_type,
+        "servers": [dict(_PRIVATE_SERVERS[db_type])],
+        "db": "testdb",
+        "username": "testuser",
+        "password": "testpass",
+        "ssh_tunnel": docker_test_ssh_tunnel(private_key="/tmp/docker_test_key"),
+        **overrides,
+    }
+
+
 def apply_docker_test_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
     """Rewrite localhost-style Docker test configs to use externally supplied hosts/ports."""
     updated = deepcopy(config)
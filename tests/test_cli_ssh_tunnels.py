@@ -1,23 +1,56 @@
 #!/usr/bin/env python3
 """
 SSH tunnel tests for CLI connectors
-Tests that CLI connectors can properly use SSH tunnels via Paramiko
+Tests that CLI connectors can properly use SSH tunnels via the system ssh client
 """
 
-import asyncio
+import re
 import shutil
+import socket
+from contextlib import asynccontextmanager
 import pytest
 from mcp_read_only_sql.connectors.postgresql.cli import PostgreSQLCLIConnector
 from mcp_read_only_sql.connectors.clickhouse.cli import ClickHouseCLIConnector
-from tests.docker_test_config import docker_test_server, docker_test_ssh_tunnel
-
-
-@pytest.fixture(scope="module")
-def event_loop():
-    """Create an event loop for the module"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+from tests.conftest import PG_SSH_CONFIG, first_data_cell, tsv_line_count
+from tests.docker_test_config import (
+    docker_test_private_ssh_config,
+    docker_test_server,
+    docker_test_ssh_tunnel,
+)
+
+# Probed once at import; the password case is skipped at collection without it.
+_HAS_SSHPASS = shutil.which("sshpass") is not None
+
+_AUTH_OR_SSH = re.compile(r"auth|ssh", re.IGNORECASE).search
+
+# (connector class, config, count query) for the tunnelled CLI connectors
+SSH_TUNNEL_COUNT_CASES = [
+    pytest.param(
+        PostgreSQLCLIConnector,
+        PG_SSH_CONFIG,
+        "SELECT COUNT(*) as count FROM users",
+        id="pg_key",
+    ),
+    pytest.param(
+        ClickHouseCLIConnector,
+        docker_test_private_ssh_config("ch_cli_ssh", "clickhouse"),
+        "SELECT COUNT(*) as count FROM testdb.events",
+        id="ch_key",
+    ),
+    pytest.param(
+        PostgreSQLCLIConnector,
+        docker_test_private_ssh_config(
+            "pg_cli_ssh_password",
+            ssh_tunnel=docker_test_ssh_tunnel(password="tunnelpass"),
+        ),
+        "SELECT COUNT(*) as count FROM users",
+        id="pg_password",
+        marks=pytest.mark.skipif(
+            not _HAS_SSHPASS,
+            reason="sshpass not installed; skipping CLI password tunnel test",
+        ),
+    ),
+]
 
 
 @pytest.mark.ssh
@@ -26,139 +59,57 @@ def event_loop():
 class TestCLISSHTunnels:
     """Test SSH tunneling for CLI connectors"""
 
-    async def test_postgresql_cli_with_ssh_tunnel(self):
-        """Test PostgreSQL CLI connector through SSH tunnel"""
+    @pytest.mark.parametrize(
+        ("connector_cls", "config", "query"), SSH_TUNNEL_COUNT_CASES
+    )
+    async def test_cli_with_ssh_tunnel(self, connector_cls, config, query):
+        """Test CLI connectors count rows through the SSH tunnel"""
         from conftest import make_connection
 
-        config = make_connection(
-            {
-                "connection_name": "pg_cli_ssh",
-                "type": "postgresql",
-                "servers": [{"host": "mcp-postgres-private", "port": 5432}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(
-                    private_key="/tmp/docker_test_key"
-                ),
-            }
-        )
-        connector = PostgreSQLCLIConnector(config)
-
-        # Execute query through SSH tunnel
-        result = await connector.execute_query("SELECT COUNT(*) as count FROM users")
+        connector = connector_cls(make_connection(config))
+        result = await connector.execute_query(query)
 
         assert isinstance(result, str)  # Should return TSV on success
-        lines = result.strip().split("\n")
-        assert len(lines) == 2  # Header + 1 row
-        count_value = lines[1].split("\t")[0]
-        assert int(count_value) > 0  # Should have users
-
-    async def test_postgresql_cli_with_ssh_password(self):
-        """Test PostgreSQL CLI connector with SSH password authentication"""
-        if shutil.which("sshpass") is None:
-            pytest.skip("sshpass not installed; skipping CLI password tunnel test")
-
-        from conftest import make_connection
+        assert tsv_line_count(result) == 2  # Header + 1 row
+        count_value = first_data_cell(result)
+        assert int(count_value) > 0  # Should have rows
 
-        config = make_connection(
-            {
-                "connection_name": "pg_cli_ssh_password",
-                "type": "postgresql",
-                "servers": [{"host": "mcp-postgres-private", "port": 5432}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(password="tunnelpass"),
-            }
-        )
-
-        connector = PostgreSQLCLIConnector(config)
-        result = await connector.execute_query("SELECT COUNT(*) as count FROM users")
-
-        assert isinstance(result, str)
-        lines = result.strip().split("\n")
-        assert len(lines) == 2
-        count_value = lines[1].split("\t")[0]
-        assert int(count_value) > 0
+    async def test_cli_ssh_tunnel_cleanup(self, pg_ssh_connector, monkeypatch):
+        """Test that each query tears its SSH tunnel down and the next reopens one"""
+        tunnel_ports = []
+        open_tunnel = pg_ssh_connector._get_ssh_tunnel
 
-    async def test_clickhouse_cli_with_ssh_tunnel(self):
-        """Test ClickHouse CLI connector through SSH tunnel"""
-        from conftest import make_connection
+        @asynccontextmanager
+        async def recording_tunnel(server=None):
+            async with open_tunnel(server) as local_port:
+                tunnel_ports.append(local_port)
+                yield local_port
 
-        config = make_connection(
-            {
-                "connection_name": "ch_cli_ssh",
-                "type": "clickhouse",
-                "servers": [{"host": "mcp-clickhouse-private", "port": 9000}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(
-                    private_key="/tmp/docker_test_key"
-                ),
-            }
-        )
-        connector = ClickHouseCLIConnector(config)
-
-        # Execute query through SSH tunnel
-        result = await connector.execute_query(
-            "SELECT COUNT(*) as count FROM testdb.events"
-        )
+        monkeypatch.setattr(pg_ssh_connector, "_get_ssh_tunnel", recording_tunnel)
 
-        assert isinstance(result, str)  # Should return TSV on success
-        lines = result.strip().split("\n")
-        assert len(lines) == 2  # Header + 1 row
-        count_value = lines[1].split("\t")[0]
-        assert int(count_value) > 0  # Should have events
-
-    async def test_cli_ssh_tunnel_cleanup(self):
-        """Test that SSH tunnels are properly cleaned up after use"""
-        from conftest import make_connection
-
-        config = make_connection(
-            {
-                "connection_name": "pg_cli_ssh_cleanup",
-                "type": "postgresql",
-                "servers": [{"host": "mcp-postgres-private", "port": 5432}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(
-                    private_key="/tmp/docker_test_key"
-                ),
-            }
-        )
-        connector = PostgreSQLCLIConnector(config)
-
-        # Execute multiple queries to ensure tunnel reuse works
+        # Run the queries one after another so each must bring up a fresh tunnel
         for i in range(3):
-            result = await connector.execute_query(f"SELECT {i+1} as num")
+            result = await pg_ssh_connector.execute_query(f"SELECT {i+1} as num")
             assert isinstance(result, str)  # Should return TSV on success
-            lines = result.strip().split("\n")
-            assert len(lines) == 2  # Header + 1 row
-            num_value = lines[1].split("\t")[0]
-            assert int(num_value) == i + 1
+            assert tsv_line_count(result) == 2  # Header + 1 row
+            assert int(first_data_cell(result)) == i + 1
 
-        # After context manager exits, tunnel should be closed
-        # (cleanup is automatic with async context manager)
+            # The tunnel is closed once the query returns
+            assert len(tunnel_ports) == i + 1
+            with pytest.raises(OSError):
+                socket.create_connection(("127.0.0.1", tunnel_ports[-1]), timeout=1)
 
     async def test_cli_ssh_with_wrong_credentials(self):
         """Test CLI connector handles SSH authentication failure gracefully"""
         from conftest import make_connection
 
         config = make_connection(
-            {
-                "connection_name": "bad_ssh_cli",
-                "type": "postgresql",
-                "servers": [{"host": "mcp-postgres-private", "port": 5432}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(
+            docker_test_private_ssh_config(
+                "bad_ssh_cli",
+                ssh_tunnel=docker_test_ssh_tunnel(
                     user="wronguser", password="wrongpass"
                 ),
-            }
+            )
         )
         connector = PostgreSQLCLIConnector(config)
 
@@ -170,27 +121,18 @@ class TestCLISSHTunnels:
 
         # Should get SSH auth failure
         if isinstance(exc_info.value, RuntimeError):
-            assert (
-                "auth" in str(exc_info.value).lower()
-                or "ssh" in str(exc_info.value).lower()
-            )
+            assert _AUTH_OR_SSH(str(exc_info.value))
 
     async def test_cli_ssh_disabled(self):
         """Test CLI connectors work normally when SSH is disabled"""
         from conftest import make_connection
 
         config = make_connection(
-            {
-                "connection_name": "no_ssh_cli",
-                "type": "postgresql",
-                "servers": [docker_test_server("postgresql")],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(
-                    enabled=False, password="tunnelpass"
-                ),
-            }
+            docker_test_private_ssh_config(
+                "no_ssh_cli",
+                servers=[docker_test_server("postgresql")],
+                ssh_tunnel=docker_test_ssh_tunnel(enabled=False, password="tunnelpass"),
+            )
         )
         connector = PostgreSQLCLIConnector(config)
 
@@ -198,30 +140,12 @@ class TestCLISSHTunnels:
         result = await connector.execute_query("SELECT 'direct' as connection_type")
 
         assert isinstance(result, str)  # Should return TSV on success
-        lines = result.strip().split("\n")
-        assert len(lines) == 2  # Header + 1 row
-        connection_type = lines[1].split("\t")[0]
+        assert tsv_line_count(result) == 2  # Header + 1 row
+        connection_type = first_data_cell(result)
         assert connection_type == "direct"
 
-    async def test_cli_ssh_complex_query(self):
+    async def test_cli_ssh_complex_query(self, pg_ssh_connector):
         """Test complex queries work through CLI SSH tunnel"""
-        from conftest import make_connection
-
-        config = make_connection(
-            {
-                "connection_name": "complex_ssh_cli",
-                "type": "postgresql",
-                "servers": [{"host": "mcp-postgres-private", "port": 5432}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(
-                    private_key="/tmp/docker_test_key"
-                ),
-            }
-        )
-        connector = PostgreSQLCLIConnector(config)
-
         # Complex query with joins and aggregations
         query = """
             SELECT
@@ -232,12 +156,11 @@ class TestCLISSHTunnels:
             FROM users
         """
 
-        result = await connector.execute_query(query)
+        result = await pg_ssh_connector.execute_query(query)
 
         assert isinstance(result, str)  # Should return TSV on success
-        lines = result.strip().split("\n")
-        assert len(lines) == 2  # Header + 1 row
-        columns = lines[1].split("\t")
+        assert tsv_line_count(result) == 2  # Header + 1 row
+        columns = result.split("\n", 1)[1].split("\t")
         assert len(columns) == 4  # Should return 4 columns
         # Total users should be positive
         assert int(columns[0]) > 0
@@ -4,18 +4,11 @@ Test CLI connectors with system SSH (not Paramiko)
 """
 
 import pytest
-import asyncio
-from mcp_read_only_sql.connectors.postgresql.cli import PostgreSQLCLIConnector
-from mcp_read_only_sql.connectors.clickhouse.cli import ClickHouseCLIConnector
-from tests.docker_test_config import docker_test_server, docker_test_ssh_tunnel
-
-
-@pytest.fixture(scope="module")
-def event_loop():
-    """Create an event loop for the module"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+from tests.conftest import first_data_cell, run_concurrently, tsv_line_count
+from tests.docker_test_config import (
+    docker_test_private_ssh_config,
+    docker_test_ssh_tunnel,
+)
 
 
 @pytest.mark.ssh
@@ -24,135 +17,27 @@ def event_loop():
 class TestCLISystemSSH:
     """Test system SSH tunneling for CLI connectors"""
 
-    async def test_postgresql_cli_with_system_ssh(self):
-        """Test PostgreSQL CLI connector through system SSH tunnel"""
-        from conftest import make_connection
-
-        config = make_connection(
-            {
-                "connection_name": "pg_cli_system_ssh",
-                "type": "postgresql",
-                "servers": [{"host": "mcp-postgres-private", "port": 5432}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(
-                    private_key="/tmp/docker_test_key"
-                ),
-            }
-        )
-        connector = PostgreSQLCLIConnector(config)
-
-        # Execute query through SSH tunnel
-        result = await connector.execute_query("SELECT COUNT(*) as count FROM users")
-
-        assert isinstance(result, str)  # Should return TSV on success
-        lines = result.strip().split("\n")
-        assert len(lines) == 2  # Header + 1 row
-        count_value = lines[1].split("\t")[0]
-        assert int(count_value) > 0  # Should have users
-
-    async def test_clickhouse_cli_with_system_ssh(self):
-        """Test ClickHouse CLI connector through system SSH tunnel"""
-        from conftest import make_connection
-
-        config = make_connection(
-            {
-                "connection_name": "ch_cli_system_ssh",
-                "type": "clickhouse",
-                "servers": [{"host": "mcp-clickhouse-private", "port": 9000}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(
-                    private_key="/tmp/docker_test_key"
-                ),
-            }
-        )
-        connector = ClickHouseCLIConnector(config)
-
-        # Execute query through SSH tunnel
-        result = await connector.execute_query(
-            "SELECT COUNT(*) as count FROM testdb.events"
-        )
-
-        assert isinstance(result, str)  # Should return TSV on success
-        lines = result.strip().split("\n")
-        assert len(lines) == 2  # Header + 1 row
-        count_value = lines[1].split("\t")[0]
-        assert int(count_value) > 0  # Should have events
-
     async def test_system_ssh_without_private_key(self):
         """SSH config without private_key/password is allowed (ssh-agent fallback)."""
         from conftest import make_connection
 
         config = make_connection(
-            {
-                "connection_name": "pg_cli_default_ssh",
-                "type": "postgresql",
-                "servers": [{"host": "mcp-postgres-private", "port": 5432}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(),
-            }
+            docker_test_private_ssh_config(
+                "pg_cli_default_ssh", ssh_tunnel=docker_test_ssh_tunnel()
+            )
         )
         assert config.ssh_tunnel is not None
         assert config.ssh_tunnel.private_key is None
         assert config.ssh_tunnel.password is None
 
-    async def test_system_ssh_disabled(self):
-        """Test CLI connectors work normally when SSH is disabled"""
-        from conftest import make_connection
-
-        config = make_connection(
-            {
-                "connection_name": "no_ssh_cli",
-                "type": "postgresql",
-                "servers": [docker_test_server("postgresql")],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(
-                    enabled=False, private_key="/tmp/docker_test_key"
-                ),
-            }
-        )
-        connector = PostgreSQLCLIConnector(config)
-
-        # Should connect directly without SSH
-        result = await connector.execute_query("SELECT 'direct' as connection_type")
-
-        assert isinstance(result, str)  # Should return TSV on success
-        lines = result.strip().split("\n")
-        assert len(lines) == 2  # Header + 1 row
-        connection_type = lines[1].split("\t")[0]
-        assert connection_type == "direct"
-
-    async def test_system_ssh_multiple_queries(self):
+    async def test_system_ssh_multiple_queries(self, pg_ssh_connector):
         """Test multiple queries through system SSH tunnel"""
-        from conftest import make_connection
-
-        config = make_connection(
-            {
-                "connection_name": "pg_multi_ssh",
-                "type": "postgresql",
-                "servers": [{"host": "mcp-postgres-private", "port": 5432}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": docker_test_ssh_tunnel(
-                    private_key="/tmp/docker_test_key"
-                ),
-            }
+        # Run the queries concurrently; each one opens and closes its own tunnel
+        results = await run_concurrently(
+            pg_ssh_connector, [f"SELECT {i+1} as num" for i in range(3)]
         )
-        connector = PostgreSQLCLIConnector(config)
-
-        # Execute multiple queries to test tunnel reuse
-        for i in range(3):
-            result = await connector.execute_query(f"SELECT {i+1} as num")
+        for i, result in enumerate(results):
             assert isinstance(result, str)  # Should return TSV on success
-            lines = result.strip().split("\n")
-            assert len(lines) == 2  # Header + 1 row
-            num_value = lines[1].split("\t")[0]
+            assert tsv_line_count(result) == 2  # Header + 1 row
+            num_value = first_data_cell(result)
             assert int(num_value) == i + 1
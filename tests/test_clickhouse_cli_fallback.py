@@ -1,11 +1,15 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
+_FAKE_RESULT = SimpleNamespace(column_names=("version()",), result_rows=(("24.1",),))
+
 
 @pytest.mark.anyio
 async def test_clickhouse_python_falls_back_to_cli(monkeypatch):
     from tests.conftest import make_connection
     from mcp_read_only_sql.connectors.clickhouse.python import ClickHousePythonConnector
-    from types import SimpleNamespace
 
     config = make_connection(
         {
@@ -26,55 +30,31 @@ async def test_clickhouse_python_falls_back_to_cli(monkeypatch):
 
     connector = ClickHousePythonConnector(config)
 
-    class FakeSSHTunnel:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def start(self):
-            raise RuntimeError("SSH: Authentication failed - bad key")
-
-        async def stop(self):
-            pass
-
-    cli_start_called = False
-    cli_stop_called = False
-
-    class FakeCLITunnel:
-        def __init__(self, ssh_config, remote_host, remote_port):
-            self.remote_host = remote_host
-            self.remote_port = remote_port
-
-        async def start(self):
-            nonlocal cli_start_called
-            cli_start_called = True
-            return 60000
-
-        async def stop(self):
-            nonlocal cli_stop_called
-            cli_stop_called = True
-
-    class FakeClient:
-        def __init__(self, **kwargs):
-            self.kwargs = kwargs
+    fake_ssh_tunnel = MagicMock()
+    fake_ssh_tunnel.return_value.start = AsyncMock(
+        side_effect=RuntimeError("SSH: Authentication failed - bad key")
+    )
+    fake_ssh_tunnel.return_value.stop = AsyncMock()
 
-        def query(self, query, column_oriented=False):
-            return SimpleNamespace(column_names=["version()"], result_rows=[["24.1"]])
+    fake_cli_tunnel = MagicMock()
+    fake_cli_tunnel.return_value.start = AsyncMock(return_value=60000)
+    fake_cli_tunnel.return_value.stop = AsyncMock()
 
-        def close(self):
-            pass
+    fake_client = MagicMock()
+    fake_client.query.return_value = _FAKE_RESULT
 
-    monkeypatch.setattr("mcp_read_only_sql.utils.ssh_tunnel.SSHTunnel", FakeSSHTunnel)
+    monkeypatch.setattr("mcp_read_only_sql.utils.ssh_tunnel.SSHTunnel", fake_ssh_tunnel)
     monkeypatch.setattr(
-        "mcp_read_only_sql.connectors.clickhouse.python.CLISSHTunnel", FakeCLITunnel
+        "mcp_read_only_sql.connectors.clickhouse.python.CLISSHTunnel", fake_cli_tunnel
     )
     monkeypatch.setattr(
         "mcp_read_only_sql.connectors.clickhouse.python.clickhouse_connect.get_client",
-        lambda **kw: FakeClient(**kw),
+        MagicMock(return_value=fake_client),
     )
 
     result = await connector.execute_query("SELECT version()")
 
     assert "version()" in result
     assert "24.1" in result
-    assert cli_start_called
-    assert cli_stop_called
+    assert fake_cli_tunnel.return_value.start.await_count == 1
+    assert fake_cli_tunnel.return_value.stop.await_count == 1
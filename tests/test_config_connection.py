@@ -3,15 +3,70 @@
 Tests for Connection configuration classes
 """
 
+import re
+
 import pytest
-import tempfile
-import os
+import yaml
 from mcp_read_only_sql.config import (
     Connection,
     Server,
     SSHTunnelConfig,
     load_connections,
+    load_connections_from_text,
 )
+from mcp_read_only_sql.utils.yaml_io import SafeYamlLoader
+
+# Validation messages matched by pytest.raises, compiled once per module.
+MISSING_FIELD = {
+    field: re.compile(f"missing required field '{field}'")
+    for field in (
+        "host",
+        "port",
+        "user",
+        "connection_name",
+        "type",
+        "servers",
+        "username",
+    )
+}
+MISSING_FIELD["db"] = re.compile("missing required field 'db' or 'allowed_databases'")
+PASSWORD_ENV_UNSUPPORTED = re.compile("Field 'password_env' is no longer supported")
+
+
+# Parsed once per module; tests using these only read attributes.
+@pytest.fixture(scope="module")
+def minimal_conn():
+    """Minimal valid PostgreSQL connection"""
+    return Connection(
+        {
+            "connection_name": "test",
+            "type": "postgresql",
+            "servers": [{"host": "localhost", "port": 5432}],
+            "db": "testdb",
+            "username": "testuser",
+            "password": "testpass",
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def conn_with_ssh():
+    """PostgreSQL connection reached through a key-authenticated SSH tunnel"""
+    return Connection(
+        {
+            "connection_name": "test",
+            "type": "postgresql",
+            "servers": [{"host": "db.internal", "port": 5432}],
+            "db": "testdb",
+            "username": "testuser",
+            "password": "testpass",
+            "ssh_tunnel": {
+                "host": "bastion.example.com",
+                "user": "tunneluser",
+                "private_key": "~/.ssh/id_rsa",
+            },
+        }
+    )
 
 
 class TestServer:
@@ -29,33 +84,29 @@ class TestServer:
         assert server.host == "localhost"
         assert server.port == 5432
 
-    def test_server_from_string_without_port_postgresql(self):
-        """Test creating Server from 'host' string for PostgreSQL"""
-        server = Server.from_dict("localhost", "postgresql", "cli")
+    @pytest.mark.parametrize(
+        ("db_type", "implementation", "port"),
+        [
+            ("postgresql", "cli", 5432),
+            ("postgresql", "python", 5432),
+            ("clickhouse", "cli", 9000),
+            ("clickhouse", "python", 8123),
+        ],
+    )
+    def test_server_from_string_default_port(self, db_type, implementation, port):
+        """Test creating Server from 'host' string uses the type's default port"""
+        server = Server.from_dict("localhost", db_type, implementation)
         assert server.host == "localhost"
-        assert server.port == 5432
+        assert server.port == port
 
-    def test_server_from_string_without_port_clickhouse_cli(self):
-        """Test creating Server from 'host' string for ClickHouse CLI"""
-        server = Server.from_dict("localhost", "clickhouse", "cli")
-        assert server.host == "localhost"
-        assert server.port == 9000
-
-    def test_server_from_string_without_port_clickhouse_python(self):
-        """Test creating Server from 'host' string for ClickHouse Python"""
-        server = Server.from_dict("localhost", "clickhouse", "python")
-        assert server.host == "localhost"
-        assert server.port == 8123
-
-    def test_server_from_dict_missing_host(self):
-        """Test Server validation catches missing host"""
-        with pytest.raises(ValueError, match="missing required field 'host'"):
-            Server.from_dict({"port": 5432})
-
-    def test_server_from_dict_missing_port(self):
-        """Test Server validation catches missing port"""
-        with pytest.raises(ValueError, match="missing required field 'port'"):
-            Server.from_dict({"host": "localhost"})
+    @pytest.mark.parametrize(
+        ("server_data", "field"),
+        [({"port": 5432}, "host"), ({"host": "localhost"}, "port")],
+    )
+    def test_server_from_dict_missing_field(self, server_data, field):
+        """Test Server validation catches missing host or port"""
+        with pytest.raises(ValueError, match=MISSING_FIELD[field]):
+            Server.from_dict(server_data)
 
 
 class TestSSHTunnelConfig:
@@ -87,9 +138,7 @@ class TestSSHTunnelConfig:
 
     def test_ssh_tunnel_rejects_password_env(self):
         """Legacy password_env should fail with a clear message."""
-        with pytest.raises(
-            ValueError, match="Field 'password_env' is no longer supported"
-        ):
+        with pytest.raises(ValueError, match=PASSWORD_ENV_UNSUPPORTED):
             SSHTunnelConfig.from_dict(
                 {
                     "host": "bastion.example.com",
@@ -98,19 +147,17 @@ class TestSSHTunnelConfig:
                 }
             )
 
-    def test_ssh_tunnel_missing_host(self):
-        """Test SSH tunnel validation catches missing host"""
-        with pytest.raises(ValueError, match="missing required field 'host'"):
-            SSHTunnelConfig.from_dict(
-                {"user": "tunneluser", "private_key": "~/.ssh/id_rsa"}
-            )
-
-    def test_ssh_tunnel_missing_user(self):
-        """Test SSH tunnel validation catches missing user"""
-        with pytest.raises(ValueError, match="missing required field 'user'"):
-            SSHTunnelConfig.from_dict(
-                {"host": "bastion.example.com", "private_key": "~/.ssh/id_rsa"}
-            )
+    @pytest.mark.parametrize(
+        ("ssh_data", "field"),
+        [
+            ({"user": "tunneluser", "private_key": "~/.ssh/id_rsa"}, "host"),
+            ({"host": "bastion.example.com", "private_key": "~/.ssh/id_rsa"}, "user"),
+        ],
+    )
+    def test_ssh_tunnel_missing_field(self, ssh_data, field):
+        """Test SSH tunnel validation catches missing host or user"""
+        with pytest.raises(ValueError, match=MISSING_FIELD[field]):
+            SSHTunnelConfig.from_dict(ssh_data)
 
     def test_ssh_tunnel_agent_only_auth(self):
         """SSH tunnel may omit credentials to fall back to ssh-agent identities"""
@@ -137,18 +184,9 @@ class TestSSHTunnelConfig:
 class TestConnection:
     """Test Connection class"""
 
-    def test_connection_minimal_valid(self):
+    def test_connection_minimal_valid(self, minimal_conn):
         """Test creating minimal valid connection"""
-        conn = Connection(
-            {
-                "connection_name": "test",
-                "type": "postgresql",
-                "servers": [{"host": "localhost", "port": 5432}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-            }
-        )
+        conn = minimal_conn
 
         assert conn.name == "test"
         assert conn.db_type == "postgresql"
@@ -161,23 +199,9 @@ class TestConnection:
         assert conn.implementation == "cli"  # default
         assert conn.ssh_tunnel is None
 
-    def test_connection_with_ssh_tunnel(self):
+    def test_connection_with_ssh_tunnel(self, conn_with_ssh):
         """Test connection with SSH tunnel"""
-        conn = Connection(
-            {
-                "connection_name": "test",
-                "type": "postgresql",
-                "servers": [{"host": "db.internal", "port": 5432}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "ssh_tunnel": {
-                    "host": "bastion.example.com",
-                    "user": "tunneluser",
-                    "private_key": "~/.ssh/id_rsa",
-                },
-            }
-        )
+        conn = conn_with_ssh
 
         assert conn.ssh_tunnel is not None
         assert conn.ssh_tunnel.host == "bastion.example.com"
@@ -267,9 +291,7 @@ class TestConnection:
 
     def test_connection_missing_name(self):
         """Test connection validation catches missing name"""
-        with pytest.raises(
-            ValueError, match="missing required field 'connection_name'"
-        ):
+        with pytest.raises(ValueError, match=MISSING_FIELD["connection_name"]):
             Connection(
                 {
                     "type": "postgresql",
@@ -282,7 +304,7 @@ class TestConnection:
 
     def test_connection_missing_type(self):
         """Test connection validation catches missing type"""
-        with pytest.raises(ValueError, match="missing required field 'type'"):
+        with pytest.raises(ValueError, match=MISSING_FIELD["type"]):
             Connection(
                 {
                     "connection_name": "test",
@@ -309,7 +331,7 @@ class TestConnection:
 
     def test_connection_missing_servers(self):
         """Test connection validation catches missing servers"""
-        with pytest.raises(ValueError, match="missing required field 'servers'"):
+        with pytest.raises(ValueError, match=MISSING_FIELD["servers"]):
             Connection(
                 {
                     "connection_name": "test",
@@ -336,9 +358,7 @@ class TestConnection:
 
     def test_connection_missing_db(self):
         """Test connection validation catches missing db"""
-        with pytest.raises(
-            ValueError, match="missing required field 'db' or 'allowed_databases'"
-        ):
+        with pytest.raises(ValueError, match=MISSING_FIELD["db"]):
             Connection(
                 {
                     "connection_name": "test",
@@ -351,7 +371,7 @@ class TestConnection:
 
     def test_connection_missing_username(self):
         """Test connection validation catches missing username"""
-        with pytest.raises(ValueError, match="missing required field 'username'"):
+        with pytest.raises(ValueError, match=MISSING_FIELD["username"]):
             Connection(
                 {
                     "connection_name": "test",
@@ -394,9 +414,7 @@ class TestConnection:
 
     def test_connection_rejects_password_env(self):
         """Legacy password_env should fail with a clear message."""
-        with pytest.raises(
-            ValueError, match="Field 'password_env' is no longer supported"
-        ):
+        with pytest.raises(ValueError, match=PASSWORD_ENV_UNSUPPORTED):
             Connection(
                 {
                     "connection_name": "test",
@@ -484,7 +502,7 @@ class TestConnection:
 class TestLoadConnections:
     """Test load_connections function"""
 
-    def test_load_connections_valid_yaml(self):
+    def test_load_connections_valid_yaml(self, tmp_path):
         """Test loading valid connections from YAML"""
         yaml_content = """
 - connection_name: test1
@@ -503,20 +521,15 @@ class TestLoadConnections:
   username: clickuser
   password: clickpass
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            connections = load_connections(temp_path)
-            assert len(connections) == 2
-            assert "test1" in connections
-            assert "test2" in connections
-            assert connections["test1"].db_type == "postgresql"
-            assert connections["test2"].db_type == "clickhouse"
-        finally:
-            os.unlink(temp_path)
+        config_file = tmp_path / "connections.yaml"
+        config_file.write_text(yaml_content)
+
+        connections = load_connections(str(config_file))
+        assert len(connections) == 2
+        assert "test1" in connections
+        assert "test2" in connections
+        assert connections["test1"].db_type == "postgresql"
+        assert connections["test2"].db_type == "clickhouse"
 
     def test_load_connections_duplicate_names(self):
         """Test loader catches duplicate connection names"""
@@ -537,18 +550,8 @@ class TestLoadConnections:
   username: clickuser
   password: clickpass
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            with pytest.raises(
-                ValueError, match="Duplicate connection name: 'duplicate'"
-            ):
-                load_connections(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError, match="Duplicate connection name: 'duplicate'"):
+            load_connections_from_text(yaml_content)
 
     def test_load_connections_rejects_legacy_max_result_bytes(self):
         """Loading a legacy config should surface removed size-limit fields."""
@@ -562,16 +565,8 @@ class TestLoadConnections:
   password: testpass
   max_result_bytes: 1024
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="max_result_bytes"):
-                load_connections(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError, match="max_result_bytes"):
+            load_connections_from_text(yaml_content)
 
     def test_load_connections_file_not_found(self):
         """Test loader handles missing file"""
@@ -580,30 +575,14 @@ class TestLoadConnections:
 
     def test_load_connections_empty_file(self):
         """Test loader handles empty file"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("")
-            f.flush()
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="Configuration file is empty"):
-                load_connections(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError, match="Configuration file is empty"):
+            load_connections_from_text("")
 
     def test_load_connections_invalid_yaml(self):
         """Test loader handles invalid YAML structure"""
         yaml_content = "just_a_string"  # Valid YAML but not a list
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="must contain a list"):
-                load_connections(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError, match="must contain a list"):
+            load_connections_from_text(yaml_content)
 
     def test_load_connections_collects_all_errors(self):
         """Test loader collects all validation errors"""
@@ -622,19 +601,18 @@ class TestLoadConnections:
   username: testuser
   password: testpass
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError) as exc_info:
-                load_connections(temp_path)
-
-            error_msg = str(exc_info.value)
-            assert "bad1" in error_msg
-            assert "bad2" in error_msg
-            assert "Invalid database type" in error_msg
-            assert "missing required field 'servers'" in error_msg
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError) as exc_info:
+            load_connections_from_text(yaml_content)
+
+        error_msg = str(exc_info.value)
+        assert "bad1" in error_msg
+        assert "bad2" in error_msg
+        assert "Invalid database type" in error_msg
+        assert "missing required field 'servers'" in error_msg
+
+    def test_loader_uses_libyaml_when_available(self):
+        """Test YAML configs are parsed with libyaml whenever PyYAML was built with it"""
+        if yaml.__with_libyaml__:
+            assert SafeYamlLoader is yaml.CSafeLoader
+        else:
+            assert SafeYamlLoader is yaml.SafeLoader
@@ -68,6 +68,21 @@ class TestGetConnectionTarget:
         assert result["database"] == "default"
         assert result["connection_type"] == "ssh_local"
 
+    def test_ssh_tunnel_to_ipv6_loopback(self):
+        """Test SSH tunnel where DB is on ::1 (IPv6 localhost)"""
+        config = {
+            "type": "postgresql",
+            "db": "mydb",
+            "servers": [{"host": "::1", "port": 5432}],
+            "ssh_tunnel": {"host": "ssh.example.com"},
+        }
+
+        result = get_connection_target(config)
+
+        assert result["host"] == "ssh.example.com"
+        assert result["port"] == 5432
+        assert result["connection_type"] == "ssh_local"
+
     def test_ssh_tunnel_as_jump(self):
         """Test SSH tunnel used as jump server to reach remote DB"""
         config = {
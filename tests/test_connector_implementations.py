@@ -2,15 +2,17 @@
 Test that the default implementation is CLI when not specified.
 """
 
-import tempfile
+import pytest
 import yaml
-import os
 from mcp_read_only_sql.config.parser import ConfigParser
+from mcp_read_only_sql.connectors.clickhouse.cli import ClickHouseCLIConnector
+from mcp_read_only_sql.connectors.postgresql.cli import PostgreSQLCLIConnector
+from mcp_read_only_sql.connectors.postgresql.python import PostgreSQLPythonConnector
 from mcp_read_only_sql.server import ReadOnlySQLServer
 from mcp_read_only_sql.runtime_paths import resolve_runtime_paths
 
 
-def test_parser_default_implementation():
+def test_parser_default_implementation(tmp_path):
     """Test that ConfigParser defaults to CLI implementation"""
     test_config = [
         {
@@ -21,74 +23,59 @@ def test_parser_default_implementation():
         }
     ]
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(test_config, f)
-        temp_file = f.name
-
-    try:
-        parser = ConfigParser(temp_file)
-        loaded = parser.load_config()
-
-        assert (
-            loaded[0].get("implementation") == "cli"
-        ), "Default implementation should be 'cli'"
-    finally:
-        os.unlink(temp_file)
-
-
-def test_server_default_implementation(tmp_path):
-    """Test that server defaults to CLI implementation when not specified in config"""
-    test_config = [
-        {
-            "connection_name": "test_postgres",
-            "type": "postgresql",
-            "servers": ["localhost:5432"],
-            "username": "testuser",
-            "password": "testpass",
-            "db": "testdb",
-            # Note: implementation not specified - should default to CLI
-        }
-    ]
-
     config_file = tmp_path / "connections.yaml"
     config_file.write_text(yaml.dump(test_config))
-    runtime_paths = resolve_runtime_paths(
-        config_dir=tmp_path,
-        state_dir=tmp_path / "state",
-        cache_dir=tmp_path / "cache",
-    )
-    runtime_paths.ensure_directories()
-
-    server = ReadOnlySQLServer(runtime_paths)
-
-    # Check the loaded connection uses CLI implementation
-    conn = server.connections.get("test_postgres")
-    assert conn is not None, "Connection should be loaded"
-
-    # Check it's a CLI connector
-    from mcp_read_only_sql.connectors.postgresql.cli import PostgreSQLCLIConnector
-
-    assert isinstance(
-        conn, PostgreSQLCLIConnector
-    ), "Should use CLI connector by default"
-
-
-def test_explicit_python_implementation(tmp_path):
-    """Test that explicitly specifying Python implementation still works"""
-    test_config = [
-        {
-            "connection_name": "test_postgres_python",
-            "type": "postgresql",
-            "servers": ["localhost:5432"],
-            "username": "testuser",
-            "password": "testpass",
-            "db": "testdb",
-            "implementation": "python",  # Explicitly specify Python
-        }
-    ]
+    loaded = ConfigParser(config_file).load_config()
+
+    assert (
+        loaded[0].get("implementation") == "cli"
+    ), "Default implementation should be 'cli'"
+
+
+@pytest.mark.parametrize(
+    "db_type,server,implementation,expected_cls",
+    [
+        # Note: implementation not specified - should default to CLI
+        pytest.param(
+            "postgresql",
+            "localhost:5432",
+            None,
+            PostgreSQLCLIConnector,
+            id="default_cli",
+        ),
+        pytest.param(
+            "postgresql",
+            "localhost:5432",
+            "python",
+            PostgreSQLPythonConnector,
+            id="explicit_python",
+        ),
+        pytest.param(
+            "clickhouse",
+            "localhost:9000",
+            "cli",
+            ClickHouseCLIConnector,
+            id="explicit_cli",
+        ),
+    ],
+)
+def test_server_connector_implementation(
+    tmp_path, db_type, server, implementation, expected_cls
+):
+    """Test that the server builds the connector matching the configured implementation"""
+    conn_config = {
+        "connection_name": "test_conn",
+        "type": db_type,
+        "servers": [server],
+        "username": "testuser",
+        "password": "testpass",
+        "db": "testdb",
+    }
+    if implementation is not None:
+        conn_config["implementation"] = implementation
 
     config_file = tmp_path / "connections.yaml"
-    config_file.write_text(yaml.dump(test_config))
+    config_file.write_text(yaml.dump([conn_config]))
     runtime_paths = resolve_runtime_paths(
         config_dir=tmp_path,
         state_dir=tmp_path / "state",
@@ -96,48 +83,8 @@ def test_explicit_python_implementation(tmp_path):
     )
     runtime_paths.ensure_directories()
 
-    server = ReadOnlySQLServer(runtime_paths)
-    conn = server.connections.get("test_postgres_python")
-    assert conn is not None, "Connection should be loaded"
-
-    # Check it's a Python connector
-    from mcp_read_only_sql.connectors.postgresql.python import PostgreSQLPythonConnector
-
-    assert isinstance(
-        conn, PostgreSQLPythonConnector
-    ), "Should use Python connector when explicitly specified"
+    server_instance = ReadOnlySQLServer(runtime_paths)
 
-
-def test_explicit_cli_implementation(tmp_path):
-    """Test that explicitly specifying CLI implementation works"""
-    test_config = [
-        {
-            "connection_name": "test_clickhouse_cli",
-            "type": "clickhouse",
-            "servers": ["localhost:9000"],
-            "username": "testuser",
-            "password": "testpass",
-            "db": "testdb",
-            "implementation": "cli",  # Explicitly specify CLI
-        }
-    ]
-
-    config_file = tmp_path / "connections.yaml"
-    config_file.write_text(yaml.dump(test_config))
-    runtime_paths = resolve_runtime_paths(
-        config_dir=tmp_path,
-        state_dir=tmp_path / "state",
-        cache_dir=tmp_path / "cache",
-    )
-    runtime_paths.ensure_directories()
-
-    server = ReadOnlySQLServer(runtime_paths)
-    conn = server.connections.get("test_clickhouse_cli")
+    conn = server_instance.connections.get("test_conn")
     assert conn is not None, "Connection should be loaded"
-
-    # Check it's a CLI connector
-    from mcp_read_only_sql.connectors.clickhouse.cli import ClickHouseCLIConnector
-
-    assert isinstance(
-        conn, ClickHouseCLIConnector
-    ), "Should use CLI connector when explicitly specified"
+    assert isinstance(conn, expected_cls)
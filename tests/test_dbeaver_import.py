@@ -3,6 +3,7 @@ import stat
 import sys
 from pathlib import Path
 
+import pytest
 import yaml
 
 from mcp_read_only_sql.config.dbeaver_import import DBeaverImporter, main
@@ -26,12 +27,22 @@ def _write_dbeaver_workspace(tmp_path: Path, connections: list[dict]) -> Path:
     return workspace
 
 
+@pytest.fixture
+def fake_decrypt(monkeypatch):
+    """Return fixed credentials for connection c1 instead of calling openssl."""
+
+    def _fake_decrypt(self):
+        return {"c1": {"user": "grafana", "password": "secret"}}, {}
+
+    monkeypatch.setattr(DBeaverImporter, "_decrypt_credentials", _fake_decrypt)
+
+
 def _run_import(monkeypatch, argv: list[str]) -> None:
     monkeypatch.setattr(sys, "argv", ["dbeaver_import", *argv])
     main()
 
 
-def test_dry_run_skips_writes(tmp_path, monkeypatch, capsys):
+def test_dry_run_skips_writes(tmp_path, monkeypatch, capsys, fake_decrypt):
     workspace = _write_dbeaver_workspace(
         tmp_path,
         [
@@ -44,11 +55,6 @@ def test_dry_run_skips_writes(tmp_path, monkeypatch, capsys):
         ],
     )
 
-    def _fake_decrypt(self):
-        return {"c1": {"user": "grafana", "password": "secret"}}, {}
-
-    monkeypatch.setattr(DBeaverImporter, "_decrypt_credentials", _fake_decrypt)
-
     output_path = tmp_path / "connections.yaml"
     output_path.write_text("- connection_name: existing\n  type: clickhouse\n")
 
@@ -71,7 +77,7 @@ def test_dry_run_skips_writes(tmp_path, monkeypatch, capsys):
     assert not list(tmp_path.glob("connections.yaml.bak.*"))
 
 
-def test_only_merges_with_existing(tmp_path, monkeypatch, capsys):
+def test_only_merges_with_existing(tmp_path, monkeypatch, capsys, fake_decrypt):
     workspace = _write_dbeaver_workspace(
         tmp_path,
         [
@@ -84,23 +90,16 @@ def test_only_merges_with_existing(tmp_path, monkeypatch, capsys):
         ],
     )
 
-    def _fake_decrypt(self):
-        return {"c1": {"user": "grafana", "password": "secret"}}, {}
-
-    monkeypatch.setattr(DBeaverImporter, "_decrypt_credentials", _fake_decrypt)
-
     output_path = tmp_path / "connections.yaml"
-    existing = [
-        {
-            "connection_name": "existing_conn",
-            "type": "clickhouse",
-            "servers": ["old-host:8123"],
-            "db": "default",
-            "username": "old_user",
-            "implementation": "cli",
-        }
-    ]
-    output_path.write_text(yaml.safe_dump(existing, sort_keys=False))
+    output_path.write_text(
+        "- connection_name: existing_conn\n"
+        "  type: clickhouse\n"
+        "  servers:\n"
+        "  - old-host:8123\n"
+        "  db: default\n"
+        "  username: old_user\n"
+        "  implementation: cli\n"
+    )
 
     _run_import(
         monkeypatch,
@@ -129,7 +128,9 @@ def test_only_merges_with_existing(tmp_path, monkeypatch, capsys):
     assert stat.S_IMODE(backup_path.stat().st_mode) == 0o600
 
 
-def test_import_does_not_write_credentials_files(tmp_path, monkeypatch, capsys):
+def test_import_does_not_write_credentials_files(
+    tmp_path, monkeypatch, capsys, fake_decrypt
+):
     workspace = _write_dbeaver_workspace(
         tmp_path,
         [
@@ -142,11 +143,6 @@ def test_import_does_not_write_credentials_files(tmp_path, monkeypatch, capsys):
         ],
     )
 
-    def _fake_decrypt(self):
-        return {"c1": {"user": "grafana", "password": "secret"}}, {}
-
-    monkeypatch.setattr(DBeaverImporter, "_decrypt_credentials", _fake_decrypt)
-
     output_path = tmp_path / "connections.yaml"
     output_path.write_text("- connection_name: existing\n  type: clickhouse\n")
 
@@ -9,6 +9,7 @@ import pytest
 from mcp_read_only_sql.config.parser import ConfigParser
 from mcp_read_only_sql.connectors.postgresql.python import PostgreSQLPythonConnector
 from mcp_read_only_sql.connectors.clickhouse.python import ClickHousePythonConnector
+from tests.conftest import first_data_cell, tsv_line_count
 from tests.docker_test_config import apply_docker_test_overrides
 
 
@@ -16,17 +17,18 @@ from tests.docker_test_config import apply_docker_test_overrides
 def test_connections():
     """Load test connections configuration"""
     parser = ConfigParser("tests/connections-test.yaml")
-    return [apply_docker_test_overrides(config) for config in parser.load_config()]
+    return {
+        config["connection_name"]: apply_docker_test_overrides(config)
+        for config in parser.load_config()
+    }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def postgres_conn(test_connections):
     """Get PostgreSQL test connection"""
     from conftest import make_connection
 
-    config = next(
-        (c for c in test_connections if c["connection_name"] == "test_postgres"), None
-    )
+    config = test_connections.get("test_postgres")
     if not config:
         pytest.skip("test_postgres connection not configured")
     # Ensure password is set for tests
@@ -35,14 +37,12 @@ def postgres_conn(test_connections):
     return PostgreSQLPythonConnector(make_connection(config))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def clickhouse_conn(test_connections):
     """Get ClickHouse test connection"""
     from conftest import make_connection
 
-    config = next(
-        (c for c in test_connections if c["connection_name"] == "test_clickhouse"), None
-    )
+    config = test_connections.get("test_clickhouse")
     if not config:
         pytest.skip("test_clickhouse connection not configured")
     # Ensure password is set for tests
@@ -62,27 +62,22 @@ class TestPostgreSQLData:
             "SELECT COUNT(*) as count FROM users"
         )
         assert isinstance(result, str)
-        lines = result.strip().split("\n")
-        assert len(lines) >= 2  # Header + data
-        row_values = lines[1].split("\t")
-        assert int(row_values[0]) > 0  # Just verify there's data
+        assert tsv_line_count(result) >= 2  # Header + data
+        assert int(first_data_cell(result)) > 0  # Just verify there's data
 
     async def test_select_queries_work(self, postgres_conn):
         """Test that SELECT queries work properly"""
         # Simple select
         result = await postgres_conn.execute_query("SELECT 1 as test")
         assert isinstance(result, str)
-        lines = result.strip().split("\n")
-        row_values = lines[1].split("\t")
-        assert row_values[0] == "1"
+        assert first_data_cell(result) == "1"
 
         # Query with WHERE clause
         result = await postgres_conn.execute_query(
             "SELECT * FROM users WHERE id > 0 LIMIT 5"
         )
         assert isinstance(result, str)
-        lines = result.strip().split("\n")
-        assert len(lines) > 1  # Has rows
+        assert tsv_line_count(result) > 1  # Has rows
 
 
 @pytest.mark.docker
@@ -96,19 +91,15 @@ class TestClickHouseData:
             "SELECT COUNT(*) as count FROM testdb.events"
         )
         assert isinstance(result, str)
-        lines = result.strip().split("\n")
-        assert len(lines) >= 2  # Header + data
-        row_values = lines[1].split("\t")
-        assert int(row_values[0]) > 0  # Just verify there's data
+        assert tsv_line_count(result) >= 2  # Header + data
+        assert int(first_data_cell(result)) > 0  # Just verify there's data
 
     async def test_select_queries_work(self, clickhouse_conn):
         """Test that SELECT queries work properly"""
         # Simple select
         result = await clickhouse_conn.execute_query("SELECT 1 as test")
         assert isinstance(result, str)
-        lines = result.strip().split("\n")
-        row_values = lines[1].split("\t")
-        assert row_values[0] == "1"
+        assert first_data_cell(result) == "1"
 
         # Query with WHERE and GROUP BY
         result = await clickhouse_conn.execute_query("""
@@ -118,8 +109,7 @@ class TestClickHouseData:
             LIMIT 5
         """)
         assert isinstance(result, str)
-        lines = result.strip().split("\n")
-        assert len(lines) > 1  # Has rows
+        assert tsv_line_count(result) > 1  # Has rows
 
 
 @pytest.mark.docker
@@ -132,24 +122,20 @@ class TestCrossDatabase:
         # PostgreSQL
         pg_result = await postgres_conn.execute_query("SELECT 1 as test")
         assert isinstance(pg_result, str)
-        lines = pg_result.strip().split("\n")
-        assert lines[1].split("\t")[0] == "1"
+        assert first_data_cell(pg_result) == "1"
 
         # ClickHouse
         ch_result = await clickhouse_conn.execute_query("SELECT 1 as test")
         assert isinstance(ch_result, str)
-        lines = ch_result.strip().split("\n")
-        assert lines[1].split("\t")[0] == "1"
+        assert first_data_cell(ch_result) == "1"
 
         # Both have data
         pg_data = await postgres_conn.execute_query("SELECT COUNT(*) as c FROM users")
         assert isinstance(pg_data, str)
-        lines = pg_data.strip().split("\n")
-        assert int(lines[1].split("\t")[0]) > 0
+        assert int(first_data_cell(pg_data)) > 0
 
         ch_data = await clickhouse_conn.execute_query(
             "SELECT COUNT(*) as c FROM testdb.events"
         )
         assert isinstance(ch_data, str)
-        lines = ch_data.strip().split("\n")
-        assert int(lines[1].split("\t")[0]) > 0
+        assert int(first_data_cell(ch_data)) > 0
@@ -4,86 +4,152 @@ Error handling tests
 Tests various error conditions and ensures proper error messages are returned
 """
 
-import pytest
-from mcp_read_only_sql.connectors.postgresql.python import PostgreSQLPythonConnector
-from mcp_read_only_sql.connectors.postgresql.cli import PostgreSQLCLIConnector
-from mcp_read_only_sql.connectors.clickhouse.python import ClickHousePythonConnector
-from mcp_read_only_sql.connectors.clickhouse.cli import ClickHouseCLIConnector
-from tests.docker_test_config import docker_test_host, docker_test_server
-
-
-@pytest.fixture
-def postgres_python_conn():
-    """PostgreSQL Python connector with valid config"""
-    from conftest import make_connection
+import re
 
-    config = make_connection(
-        {
-            "connection_name": "test_pg",
-            "type": "postgresql",
-            "servers": [docker_test_server("postgresql")],
-            "db": "testdb",
-            "allowed_databases": ["testdb", "nonexistent_db"],
-            "username": "testuser",
-            "password": "testpass",
-        }
-    )
-    return PostgreSQLPythonConnector(config)
+import pytest
+from tests.conftest import build_connector
+from tests.docker_test_config import docker_test_host
 
 
-@pytest.fixture
-def postgres_cli_conn():
-    """PostgreSQL CLI connector with valid config"""
-    from conftest import make_connection
+@pytest.fixture(scope="module")
+def connector_factory():
+    """Return a builder for valid-config connectors, one per (type, implementation)."""
+    connectors = {}
 
-    config = make_connection(
-        {
-            "connection_name": "test_pg_cli",
-            "type": "postgresql",
-            "servers": [docker_test_server("postgresql")],
-            "db": "testdb",
-            "allowed_databases": ["testdb", "nonexistent_db"],
-            "username": "testuser",
-            "password": "testpass",
-        }
-    )
-    return PostgreSQLCLIConnector(config)
+    def make(db_type, implementation):
+        key = (db_type, implementation)
+        if key not in connectors:
+            overrides = {"connection_name": f"test_{db_type}_{implementation}_errors"}
+            if db_type == "postgresql":
+                overrides["allowed_databases"] = ["testdb", "nonexistent_db"]
+            connectors[key] = build_connector(db_type, implementation, **overrides)
+        return connectors[key]
 
+    return make
 
-@pytest.fixture
-def clickhouse_python_conn():
-    """ClickHouse Python connector with valid config"""
-    from conftest import make_connection
 
-    config = make_connection(
+# (database type, implementation, config overrides, pattern the error must match)
+CONNECTION_ERROR_CASES = [
+    pytest.param(
+        "postgresql",
+        "python",
         {
-            "connection_name": "test_ch",
-            "type": "clickhouse",
-            "servers": [docker_test_server("clickhouse")],
-            "db": "testdb",
-            "username": "testuser",
-            "password": "testpass",
-        }
-    )
-    return ClickHousePythonConnector(config)
-
-
-@pytest.fixture
-def clickhouse_cli_conn():
-    """ClickHouse CLI connector with valid config"""
-    from conftest import make_connection
-
-    config = make_connection(
+            "servers": [{"host": "non.existent.host", "port": 5432}],
+            "connection_timeout": 2,
+        },
+        re.compile(r"connection|connect|host|resolve", re.IGNORECASE),
+        id="wrong_host",
+    ),
+    pytest.param(
+        "postgresql",
+        "python",
         {
-            "connection_name": "test_ch_cli",
-            "type": "clickhouse",
-            "servers": [docker_test_server("clickhouse")],
-            "db": "testdb",
-            "username": "testuser",
-            "password": "testpass",
-        }
-    )
-    return ClickHouseCLIConnector(config)
+            "servers": [{"host": docker_test_host(), "port": 9999}],
+            "connection_timeout": 2,
+        },
+        re.compile(r"connection|refused|port", re.IGNORECASE),
+        id="wrong_port",
+    ),
+    # PostgreSQL typically returns "authentication failed" or "connection refused" for local tests
+    pytest.param(
+        "postgresql",
+        "python",
+        {"username": "wronguser", "password": "wrongpass"},
+        re.compile(r"authentication|password|user|connection|refused", re.IGNORECASE),
+        id="wrong_credentials",
+    ),
+    pytest.param(
+        "postgresql",
+        "cli",
+        {"servers": [{"host": docker_test_host(), "port": 9999}]},
+        re.compile(r"connection|refused", re.IGNORECASE),
+        id="cli_wrong_port",
+    ),
+]
+
+# (database type, implementation, query, execute_query kwargs, pattern the error must match)
+QUERY_ERROR_CASES = [
+    pytest.param(
+        "postgresql",
+        "python",
+        "SELECT 1",
+        {"database": "nonexistent_db"},
+        re.compile(r"database|does not exist|not found", re.IGNORECASE),
+        id="database_not_found_postgres",
+    ),
+    pytest.param(
+        "clickhouse",
+        "python",
+        "SELECT 1 FROM nonexistent_db.some_table",
+        {},
+        re.compile(r"database|doesn't exist|not exist|unknown", re.IGNORECASE),
+        id="database_not_found_clickhouse",
+    ),
+    pytest.param(
+        "postgresql",
+        "cli",
+        "SELECT 1",
+        {"database": "nonexistent_db"},
+        re.compile(r"database|does not exist", re.IGNORECASE),
+        id="cli_database_not_found",
+    ),
+    pytest.param(
+        "postgresql",
+        "python",
+        "SELECT * FROM nonexistent_table",
+        {},
+        re.compile(r"relation|does not exist|table", re.IGNORECASE),
+        id="table_not_found_postgres",
+    ),
+    pytest.param(
+        "clickhouse",
+        "python",
+        "SELECT * FROM testdb.nonexistent_table",
+        {},
+        re.compile(r"table|doesn't exist|not exist|unknown", re.IGNORECASE),
+        id="table_not_found_clickhouse",
+    ),
+    pytest.param(
+        "postgresql",
+        "cli",
+        "SELECT * FROM nonexistent_table",
+        {},
+        re.compile(r"relation|does not exist|table", re.IGNORECASE),
+        id="cli_table_not_found",
+    ),
+    pytest.param(
+        "postgresql",
+        "python",
+        "SELECT nonexistent_column FROM users",
+        {},
+        re.compile(r"column|does not exist|nonexistent_column", re.IGNORECASE),
+        id="column_not_found_postgres",
+    ),
+    pytest.param(
+        "postgresql",
+        "python",
+        "SELCT * FROM users",  # Typo: SELCT instead of SELECT
+        {},
+        re.compile(r"syntax|error|selct", re.IGNORECASE),
+        id="syntax_error_postgres",
+    ),
+    pytest.param(
+        "clickhouse",
+        "python",
+        "SELCT * FROM testdb.events",  # Typo
+        {},
+        re.compile(r"syntax|error|unknown|selct", re.IGNORECASE),
+        id="syntax_error_clickhouse",
+    ),
+    pytest.param(
+        "postgresql",
+        "cli",
+        "INVALID SQL QUERY",
+        {},
+        re.compile(r"syntax|error", re.IGNORECASE),
+        id="cli_syntax_error",
+    ),
+]
 
 
 @pytest.mark.docker
@@ -91,221 +157,51 @@ def clickhouse_cli_conn():
 class TestConnectionErrors:
     """Test connection error handling"""
 
-    async def test_wrong_host(self):
-        """Test connection to non-existent host"""
-        from conftest import make_connection
-
-        config = make_connection(
-            {
-                "connection_name": "bad_host",
-                "type": "postgresql",
-                "servers": [{"host": "non.existent.host", "port": 5432}],
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "connection_timeout": 2,
-            }
-        )
-        connector = PostgreSQLPythonConnector(config)
-
-        with pytest.raises(RuntimeError) as exc_info:
-            await connector.execute_query("SELECT 1")
-
-        error_msg = str(exc_info.value).lower()
-        # Error message should indicate connection issue
-        assert any(
-            word in error_msg for word in ["connection", "connect", "host", "resolve"]
-        )
-
-    async def test_wrong_port(self):
-        """Test connection to wrong port"""
-        from conftest import make_connection
-
-        config = make_connection(
-            {
-                "connection_name": "bad_port",
-                "type": "postgresql",
-                "servers": [{"host": docker_test_host(), "port": 9999}],  # Wrong port
-                "db": "testdb",
-                "username": "testuser",
-                "password": "testpass",
-                "connection_timeout": 2,
-            }
-        )
-        connector = PostgreSQLPythonConnector(config)
-
-        with pytest.raises(RuntimeError) as exc_info:
-            await connector.execute_query("SELECT 1")
-
-        error_msg = str(exc_info.value).lower()
-        assert any(word in error_msg for word in ["connection", "refused", "port"])
-
-    async def test_wrong_credentials(self):
-        """Test connection with wrong credentials"""
-        from conftest import make_connection
-
-        config = make_connection(
-            {
-                "connection_name": "bad_creds",
-                "type": "postgresql",
-                "servers": [docker_test_server("postgresql")],
-                "db": "testdb",
-                "username": "wronguser",
-                "password": "wrongpass",
-            }
+    @pytest.mark.parametrize(
+        "db_type, implementation, overrides, error_pattern", CONNECTION_ERROR_CASES
+    )
+    async def test_connection_error(
+        self, db_type, implementation, overrides, error_pattern
+    ):
+        """Test unreachable or rejected connections raise a descriptive error"""
+        connector = build_connector(
+            db_type,
+            implementation,
+            connection_name=f"bad_{db_type}_{implementation}",
+            **overrides,
         )
-        connector = PostgreSQLPythonConnector(config)
 
         with pytest.raises(RuntimeError) as exc_info:
             await connector.execute_query("SELECT 1")
 
-        error_msg = str(exc_info.value).lower()
-        # PostgreSQL typically returns "authentication failed" or "connection refused" for local tests
-        assert any(
-            word in error_msg
-            for word in ["authentication", "password", "user", "connection", "refused"]
-        )
-
-    async def test_cli_connection_error(self, postgres_cli_conn):
-        """Test CLI connector handles connection errors"""
-        # Temporarily break the connection by using wrong port
-        from mcp_read_only_sql.config.connection import Server
-
-        postgres_cli_conn.servers = [Server(host=docker_test_host(), port=9999)]
-
-        with pytest.raises(RuntimeError) as exc_info:
-            await postgres_cli_conn.execute_query("SELECT 1")
-
-        error_msg = str(exc_info.value).lower()
-        assert "connection" in error_msg or "refused" in error_msg
+        assert error_pattern.search(str(exc_info.value))
 
 
 @pytest.mark.docker
 @pytest.mark.anyio
-class TestDatabaseErrors:
-    """Test database-related errors"""
-
-    async def test_database_not_found_postgres(self, postgres_python_conn):
-        """Test querying non-existent database in PostgreSQL"""
-        with pytest.raises(RuntimeError) as exc_info:
-            await postgres_python_conn.execute_query(
-                "SELECT 1", database="nonexistent_db"
-            )
-
-        error_msg = str(exc_info.value).lower()
-        assert any(
-            word in error_msg for word in ["database", "does not exist", "not found"]
-        )
+class TestQueryErrors:
+    """Test missing database/table/column and SQL syntax errors"""
 
-    async def test_database_not_found_clickhouse(self, clickhouse_python_conn):
-        """Test querying non-existent database in ClickHouse"""
-        with pytest.raises(RuntimeError) as exc_info:
-            await clickhouse_python_conn.execute_query(
-                "SELECT 1 FROM nonexistent_db.some_table"
-            )
-
-        error_msg = str(exc_info.value).lower()
-        assert any(
-            word in error_msg
-            for word in ["database", "doesn't exist", "not exist", "unknown"]
-        )
-
-    async def test_cli_database_not_found(self, postgres_cli_conn):
-        """Test CLI connector with non-existent database"""
-        with pytest.raises(RuntimeError) as exc_info:
-            await postgres_cli_conn.execute_query("SELECT 1", database="nonexistent_db")
-
-        error_msg = str(exc_info.value).lower()
-        assert "database" in error_msg or "does not exist" in error_msg
-
-
-@pytest.mark.docker
-@pytest.mark.anyio
-class TestTableErrors:
-    """Test table-related errors"""
-
-    async def test_table_not_found_postgres(self, postgres_python_conn):
-        """Test querying non-existent table in PostgreSQL"""
-        with pytest.raises(RuntimeError) as exc_info:
-            await postgres_python_conn.execute_query("SELECT * FROM nonexistent_table")
-
-        error_msg = str(exc_info.value).lower()
-        assert any(
-            word in error_msg for word in ["relation", "does not exist", "table"]
-        )
-
-    async def test_table_not_found_clickhouse(self, clickhouse_python_conn):
-        """Test querying non-existent table in ClickHouse"""
-        with pytest.raises(RuntimeError) as exc_info:
-            await clickhouse_python_conn.execute_query(
-                "SELECT * FROM testdb.nonexistent_table"
-            )
-
-        error_msg = str(exc_info.value).lower()
-        assert any(
-            word in error_msg
-            for word in ["table", "doesn't exist", "not exist", "unknown"]
-        )
-
-    async def test_cli_table_not_found(self, postgres_cli_conn):
-        """Test CLI connector with non-existent table"""
-        with pytest.raises(RuntimeError) as exc_info:
-            await postgres_cli_conn.execute_query("SELECT * FROM nonexistent_table")
-
-        error_msg = str(exc_info.value).lower()
-        assert any(
-            word in error_msg for word in ["relation", "does not exist", "table"]
-        )
-
-    async def test_column_not_found_postgres(self, postgres_python_conn):
-        """Test querying non-existent column in PostgreSQL"""
-        with pytest.raises(RuntimeError) as exc_info:
-            await postgres_python_conn.execute_query(
-                "SELECT nonexistent_column FROM users"
-            )
-
-        error_msg = str(exc_info.value).lower()
-        assert (
-            "column" in error_msg
-            or "does not exist" in error_msg
-            or "nonexistent_column" in error_msg
-        )
-
-
-@pytest.mark.docker
-@pytest.mark.anyio
-class TestSyntaxErrors:
-    """Test SQL syntax error handling"""
-
-    async def test_syntax_error_postgres(self, postgres_python_conn):
-        """Test invalid SQL syntax in PostgreSQL"""
-        with pytest.raises(RuntimeError) as exc_info:
-            await postgres_python_conn.execute_query(
-                "SELCT * FROM users"  # Typo: SELCT instead of SELECT
-            )
-
-        error_msg = str(exc_info.value).lower()
-        assert any(word in error_msg for word in ["syntax", "error", "selct"])
-
-    async def test_syntax_error_clickhouse(self, clickhouse_python_conn):
-        """Test invalid SQL syntax in ClickHouse"""
-        with pytest.raises(RuntimeError) as exc_info:
-            await clickhouse_python_conn.execute_query(
-                "SELCT * FROM testdb.events"  # Typo
-            )
-
-        error_msg = str(exc_info.value).lower()
-        assert any(
-            word in error_msg for word in ["syntax", "error", "unknown", "selct"]
-        )
+    @pytest.mark.parametrize(
+        "db_type, implementation, query, query_kwargs, error_pattern",
+        QUERY_ERROR_CASES,
+    )
+    async def test_query_error(
+        self,
+        connector_factory,
+        db_type,
+        implementation,
+        query,
+        query_kwargs,
+        error_pattern,
+    ):
+        """Test failing queries raise an error naming the problem"""
+        connector = connector_factory(db_type, implementation)
 
-    async def test_cli_syntax_error(self, postgres_cli_conn):
-        """Test CLI connector with syntax error"""
         with pytest.raises(RuntimeError) as exc_info:
-            await postgres_cli_conn.execute_query("INVALID SQL QUERY")
+            await connector.execute_query(query, **query_kwargs)
 
-        error_msg = str(exc_info.value).lower()
-        assert "syntax" in error_msg or "error" in error_msg
+        assert error_pattern.search(str(exc_info.value))
 
 
 @pytest.mark.docker
@@ -313,11 +209,12 @@ class TestSyntaxErrors:
 class TestErrorMessageQuality:
     """Test that error messages are helpful and descriptive"""
 
-    async def test_error_includes_query_context(self, postgres_python_conn):
+    async def test_error_includes_query_context(self, connector_factory):
         """Test that errors include helpful context"""
         query = "SELECT * FROM this_table_definitely_does_not_exist"
+        connector = connector_factory("postgresql", "python")
         with pytest.raises(RuntimeError) as exc_info:
-            await postgres_python_conn.execute_query(query)
+            await connector.execute_query(query)
 
         error_msg = str(exc_info.value)
         # Error should mention the table name or relation
@@ -326,10 +223,11 @@ class TestErrorMessageQuality:
             or "relation" in error_msg.lower()
         )
 
-    async def test_error_format_consistency(self, postgres_python_conn):
+    async def test_error_format_consistency(self, connector_factory):
         """Test that errors are raised consistently"""
+        connector = connector_factory("postgresql", "python")
         with pytest.raises(RuntimeError) as exc_info:
-            await postgres_python_conn.execute_query("SELECT * FROM nonexistent")
+            await connector.execute_query("SELECT * FROM nonexistent")
 
         # Error should be a RuntimeError with a message
         assert exc_info.type is RuntimeError
@@ -1,76 +1,73 @@
+import pytest
+
 from conftest import make_recording_connector
 from mcp_read_only_sql.server import _display_hosts_for_connector
 
+_SSH_TUNNEL = {"user": "deploy", "private_key": "/tmp/key"}
 
-def test_ssh_local_display_host_maps_back_to_localhost():
-    connector = make_recording_connector(
+# (config overrides, expected display hosts, display host to select, expected (host, port))
+HOST_MAPPING_CASES = [
+    # SSH local: the display host maps back to the DB on the SSH host's localhost
+    pytest.param(
         {
-            "connection_name": "ssh_local",
             "type": "postgresql",
-            "implementation": "cli",
             "servers": ["localhost:5432"],
-            "db": "example",
-            "username": "tester",
-            "password": "secret",
-            "ssh_tunnel": {
-                "host": "remote.example.com",
-                "user": "deploy",
-                "private_key": "/tmp/key",
-            },
-        }
-    )
-
-    display_hosts = _display_hosts_for_connector(connector)
-    assert display_hosts == ["remote.example.com"]
-
-    selected = connector._select_server(display_hosts[0])
-    assert selected.host == "localhost"
-    assert selected.port == 5432
-
-
-def test_ssh_jump_display_host_matches_remote_db():
-    connector = make_recording_connector(
+            "ssh_tunnel": {"host": "remote.example.com", **_SSH_TUNNEL},
+        },
+        ["remote.example.com"],
+        0,
+        ("localhost", 5432),
+        id="ssh_local",
+    ),
+    # SSH jump: the display host is the remote DB behind the jump host
+    pytest.param(
         {
-            "connection_name": "ssh_jump",
             "type": "postgresql",
-            "implementation": "cli",
             "servers": ["behind.example.com:5432"],
-            "db": "example",
-            "username": "tester",
-            "password": "secret",
-            "ssh_tunnel": {
-                "host": "jump.example.com",
-                "user": "deploy",
-                "private_key": "/tmp/key",
-            },
-        }
-    )
-
-    display_hosts = _display_hosts_for_connector(connector)
-    assert display_hosts == ["behind.example.com"]
-
-    selected = connector._select_server(display_hosts[0])
-    assert selected.host == "behind.example.com"
-    assert selected.port == 5432
-
-
-def test_multiple_hosts_returns_unique_entries():
-    connector = make_recording_connector(
+            "ssh_tunnel": {"host": "jump.example.com", **_SSH_TUNNEL},
+        },
+        ["behind.example.com"],
+        0,
+        ("behind.example.com", 5432),
+        id="ssh_jump",
+    ),
+    # Multiple hosts: duplicates collapse and each display host stays selectable
+    pytest.param(
         {
-            "connection_name": "multi",
             "type": "clickhouse",
-            "implementation": "cli",
             "servers": [
                 "server1.example.com:9000",
                 "server2.example.com:9000",
                 "server1.example.com:9000",
             ],
-            "db": "default",
+        },
+        ["server1.example.com", "server2.example.com"],
+        1,
+        ("server2.example.com", 9000),
+        id="multi",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "overrides, expected_display, select_index, expected_server", HOST_MAPPING_CASES
+)
+def test_display_host_maps_to_server(
+    overrides, expected_display, select_index, expected_server
+):
+    connector = make_recording_connector(
+        {
+            "connection_name": "host_mapping",
+            "implementation": "cli",
+            "db": "example",
             "username": "tester",
             "password": "secret",
+            **overrides,
         }
     )
 
     display_hosts = _display_hosts_for_connector(connector)
-    assert display_hosts == ["server1.example.com", "server2.example.com"]
-    assert connector._select_server(display_hosts[1]).host == "server2.example.com"
+    assert display_hosts == expected_display
+
+    selected = connector._select_server(display_hosts[select_index])
+    assert (selected.host, selected.port) == expected_server
@@ -1,84 +1,42 @@
 """Unified timeout regression tests."""
 
+import re
 import warnings
 
 import shutil
 import time
-from typing import Dict, Tuple
 
 import pytest
 
-from conftest import make_connection
-from mcp_read_only_sql.connectors.clickhouse.cli import ClickHouseCLIConnector
-from mcp_read_only_sql.connectors.clickhouse.python import ClickHousePythonConnector
-from mcp_read_only_sql.connectors.postgresql.cli import PostgreSQLCLIConnector
-from mcp_read_only_sql.connectors.postgresql.python import PostgreSQLPythonConnector
 from mcp_read_only_sql.utils.timeout_wrapper import HardTimeoutError
-from tests.docker_test_config import docker_test_server
+from tests.conftest import build_connector, tsv_line_count
 
 pytestmark = [pytest.mark.docker, pytest.mark.usefixtures("docker_check")]
 
 warnings.filterwarnings("ignore", category=pytest.PytestUnraisableExceptionWarning)
 
-CONNECTOR_CLASSES: Dict[Tuple[str, str], type] = {
-    ("postgresql", "python"): PostgreSQLPythonConnector,
-    ("postgresql", "cli"): PostgreSQLCLIConnector,
-    ("clickhouse", "python"): ClickHousePythonConnector,
-    ("clickhouse", "cli"): ClickHouseCLIConnector,
-}
+
+# Error-message checks, case-insensitive without lowercasing a copy of the message.
+_TIMEOUT_RE = re.compile("timeout", re.IGNORECASE)
+_HARD_TIMEOUT_RE = re.compile("hard timeout", re.IGNORECASE)
+_UNREACHABLE_RE = re.compile("connect|timeout|refused|unreach", re.IGNORECASE)
+
+_CLI_TOOLS = {"postgresql": "psql", "clickhouse": "clickhouse-client"}
+# Resolved once at import; PATH does not change during a test run.
+_MISSING_CLI_TOOLS = frozenset(
+    tool for tool in _CLI_TOOLS.values() if shutil.which(tool) is None
+)
 
 
 def ensure_cli_available(db_type: str, implementation: str) -> None:
     """Skip tests gracefully when CLI tools are missing."""
     if implementation != "cli":
         return
-    tool = "psql" if db_type == "postgresql" else "clickhouse-client"
-    if shutil.which(tool) is None:
+    tool = _CLI_TOOLS[db_type]
+    if tool in _MISSING_CLI_TOOLS:
         pytest.skip(f"{tool} command not available on PATH")
 
 
-def build_connector(db_type: str, implementation: str, **overrides):
-    """Construct a connector for the given database/implementation pair."""
-    servers = overrides.pop(
-        "servers",
-        [
-            (
-                docker_test_server(
-                    db_type,
-                    port=overrides.pop("port", None),
-                )
-                if "host" not in overrides
-                else {
-                    "host": overrides.pop("host"),
-                    "port": overrides.pop("port", docker_test_server(db_type)["port"]),
-                }
-            )
-        ],
-    )
-    connection_name = overrides.pop(
-        "connection_name", f"{db_type}_{implementation}_limits"
-    )
-    config = {
-        "connection_name": connection_name,
-        "type": db_type,
-        "implementation": implementation,
-        "servers": servers,
-        "db": overrides.pop("db", "testdb"),
-        "username": overrides.pop("username", "testuser"),
-        "password": overrides.pop("password", "testpass"),
-    }
-    config.update(overrides)
-
-    hard_timeout_override = config.pop("hard_timeout", None)
-    connection = make_connection(config)
-    connector = CONNECTOR_CLASSES[(db_type, implementation)](connection)
-
-    if hard_timeout_override is not None:
-        connector.hard_timeout = hard_timeout_override
-
-    return connector
-
-
 QUERY_TIMEOUT_CASES = [
     ("postgresql", "python", "SELECT pg_sleep(3)"),
     ("postgresql", "cli", "SELECT pg_sleep(3)"),
@@ -91,6 +49,7 @@ QUERY_TIMEOUT_IDS = [f"{db}-{impl}" for db, impl, _ in QUERY_TIMEOUT_CASES]
 
 @pytest.mark.security
 @pytest.mark.docker
+@pytest.mark.timeout(10)  # Kill test after 10 seconds to prevent hanging
 @pytest.mark.anyio
 @pytest.mark.parametrize(
     "db_type, implementation, query", QUERY_TIMEOUT_CASES, ids=QUERY_TIMEOUT_IDS
@@ -105,12 +64,12 @@ async def test_query_timeouts_are_enforced(db_type, implementation, query):
         connection_timeout=2,
     )
 
-    start = time.time()
+    start = time.monotonic()
     with pytest.raises((RuntimeError, TimeoutError)) as exc_info:
         await connector.execute_query_with_timeout(query)
-    elapsed = time.time() - start
+    elapsed = time.monotonic() - start
 
-    assert "timeout" in str(exc_info.value).lower()
+    assert _TIMEOUT_RE.search(str(exc_info.value))
     assert elapsed < 3.5
 
 
@@ -141,10 +100,11 @@ async def test_normal_queries_succeed(db_type, implementation, query):
 
     result = await connector.execute_query_with_timeout(query)
     assert isinstance(result, str)
-    assert len(result.strip().split("\n")) >= 2
+    assert tsv_line_count(result) >= 2
 
 
 @pytest.mark.docker
+@pytest.mark.timeout(10)  # Kill test after 10 seconds to prevent hanging
 @pytest.mark.anyio
 async def test_hard_timeout_is_enforced():
     connector = build_connector(
@@ -156,12 +116,12 @@ async def test_hard_timeout_is_enforced():
         hard_timeout=2,
     )
 
-    start = time.time()
+    start = time.monotonic()
     with pytest.raises(HardTimeoutError) as exc_info:
         await connector.execute_query_with_timeout("SELECT pg_sleep(5)")
-    elapsed = time.time() - start
+    elapsed = time.monotonic() - start
 
-    assert "hard timeout" in str(exc_info.value).lower()
+    assert _HARD_TIMEOUT_RE.search(str(exc_info.value))
     assert elapsed < 3
 
 
@@ -209,6 +169,7 @@ UNREACHABLE_IDS = [f"{db}-{impl}" for db, impl, _ in UNREACHABLE_HOST_CASES]
 
 
 @pytest.mark.docker
+@pytest.mark.timeout(10)  # Kill test after 10 seconds to prevent hanging
 @pytest.mark.anyio
 @pytest.mark.parametrize(
     "db_type, implementation, overrides", UNREACHABLE_HOST_CASES, ids=UNREACHABLE_IDS
@@ -222,13 +183,10 @@ async def test_unreachable_hosts_timeout(db_type, implementation, overrides):
         **overrides,
     )
 
-    start = time.time()
+    start = time.monotonic()
     with pytest.raises((RuntimeError, TimeoutError)) as exc_info:
         await connector.execute_query_with_timeout("SELECT 1")
-    elapsed = time.time() - start
+    elapsed = time.monotonic() - start
 
-    message = str(exc_info.value).lower()
-    assert any(
-        keyword in message for keyword in ("connect", "timeout", "refused", "unreach")
-    )
+    assert _UNREACHABLE_RE.search(str(exc_info.value))
     assert elapsed < 5
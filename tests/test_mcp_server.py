@@ -5,33 +5,43 @@ Tests server initialization and basic functionality
 """
 
 import pytest
-from pathlib import Path
-from tests.conftest import call_tool, execute_query, list_connections
+from mcp import ClientSession
+from mcp.client.stdio import stdio_client
+from tests.conftest import (
+    call_tool,
+    execute_query,
+    list_connections,
+    stdio_server_params,
+)
 
 pytestmark = pytest.mark.filterwarnings(
     "ignore::pytest.PytestUnraisableExceptionWarning"
 )
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="module")
+async def tools_listing(mcp_client):
+    """Tool listing of the shared server, fetched once for assertion-only tests"""
+    return await mcp_client.list_tools()
 
 
 @pytest.mark.anyio
 class TestServerBasics:
     """Test basic server functionality through MCP protocol"""
 
-    async def test_server_connection(self, mcp_client):
+    async def test_server_connection(self, mcp_client, tools_listing):
         """Test that we can connect to the server"""
         # If we get here, connection was successful
         assert mcp_client is not None
 
         # Test that we can list tools
-        tools = await mcp_client.list_tools()
+        tools = tools_listing
         assert tools is not None
         assert len(tools.tools) > 0
 
         # Check for our expected tools
-        tool_names = [t.name for t in tools.tools]
-        assert "run_query_read_only" in tool_names
-        assert "list_connections" in tool_names
+        tool_names = {t.name for t in tools.tools}
+        assert {"run_query_read_only", "list_connections"} <= tool_names
 
     async def test_list_connections(self, mcp_client):
         """Test listing connections"""
@@ -74,9 +84,9 @@ class TestServerBasics:
             error_msg = result.get("error", "").lower()
             assert "127.0.0.1" in error_msg or "connection refused" in error_msg
 
-    async def test_tool_descriptions_explain_behavior(self, mcp_client):
+    async def test_tool_descriptions_explain_behavior(self, tools_listing):
         """Tool metadata should describe parameters and TSV/path behavior."""
-        tools = await mcp_client.list_tools()
+        tools = tools_listing
 
         run_query_tool = next(t for t in tools.tools if t.name == "run_query_read_only")
         list_connections_tool = next(
@@ -122,25 +132,7 @@ class TestResolvedEndpoints:
 
     @pytest.fixture
     async def ssh_resolved_client(self, ssh_resolved_config):
-        from mcp import StdioServerParameters
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
-        import os
-
-        server_params = StdioServerParameters(
-            command="uv",
-            args=[
-                "--directory",
-                str(PROJECT_ROOT),
-                "run",
-                "python",
-                "-m",
-                "mcp_read_only_sql.server",
-                "--config-dir",
-                str(Path(ssh_resolved_config).parent),
-            ],
-            env=dict(os.environ),
-        )
+        server_params = stdio_server_params(ssh_resolved_config)
 
         async with stdio_client(server_params) as (read, write):
             async with ClientSession(read, write) as session:
@@ -198,31 +190,11 @@ class TestMultipleConnections:
         return str(config_file)
 
     @pytest.fixture
-    async def multi_server(self, multi_config_file):
-        """Server with multiple connections"""
-        from mcp import StdioServerParameters
-
-        return StdioServerParameters(
-            command="uv",
-            args=[
-                "--directory",
-                str(PROJECT_ROOT),
-                "run",
-                "python",
-                "-m",
-                "mcp_read_only_sql.server",
-                "--config-dir",
-                str(Path(multi_config_file).parent),
-            ],
-        )
-
-    @pytest.fixture
-    async def multi_client(self, multi_server):
+    async def multi_client(self, multi_config_file):
         """Client for multi-connection server"""
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
+        server_params = stdio_server_params(multi_config_file)
 
-        async with stdio_client(multi_server) as (read, write):
+        async with stdio_client(server_params) as (read, write):
             async with ClientSession(read, write) as session:
                 await session.initialize()
                 yield session
@@ -232,13 +204,10 @@ class TestMultipleConnections:
         connections = await list_connections(multi_client)
 
         assert len(connections) == 3
-        names = [c["name"] for c in connections]
-        assert "conn1" in names
-        assert "conn2" in names
-        assert "conn3" in names
+        conn_map = {c["name"]: c for c in connections}
+        assert {"conn1", "conn2", "conn3"} <= conn_map.keys()
 
         # Check types and implementations
-        conn_map = {c["name"]: c for c in connections}
         assert conn_map["conn1"]["type"] == "postgresql"
         assert conn_map["conn2"]["type"] == "clickhouse"
         assert conn_map["conn3"]["type"] == "postgresql"
@@ -268,31 +237,11 @@ class TestSecurityLimits:
         return str(config_file)
 
     @pytest.fixture
-    async def secure_server(self, secure_config_file):
-        """Server with security limits"""
-        from mcp import StdioServerParameters
-
-        return StdioServerParameters(
-            command="uv",
-            args=[
-                "--directory",
-                str(PROJECT_ROOT),
-                "run",
-                "python",
-                "-m",
-                "mcp_read_only_sql.server",
-                "--config-dir",
-                str(Path(secure_config_file).parent),
-            ],
-        )
-
-    @pytest.fixture
-    async def secure_client(self, secure_server):
+    async def secure_client(self, secure_config_file):
         """Client for secure server"""
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
+        server_params = stdio_server_params(secure_config_file)
 
-        async with stdio_client(secure_server) as (read, write):
+        async with stdio_client(server_params) as (read, write):
             async with ClientSession(read, write) as session:
                 await session.initialize()
                 yield session
@@ -318,8 +267,8 @@ class TestSecurityLimits:
 class TestServerParameter:
     """Test the optional server parameter for server selection"""
 
-    @pytest.fixture
-    def multi_server_config_file(self, tmp_path):
+    @pytest.fixture(scope="class")
+    def multi_server_config_file(self, tmp_path_factory):
         """Create config with multiple servers per connection"""
         config_content = """
 - connection_name: multi_server_conn
@@ -333,29 +282,14 @@ class TestServerParameter:
   username: user
   password: pass
 """
-        config_file = tmp_path / "connections.yaml"
+        config_file = tmp_path_factory.mktemp("multi_server") / "connections.yaml"
         config_file.write_text(config_content)
         return str(config_file)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     async def multi_server_client(self, multi_server_config_file):
-        """Client for multi-server connection"""
-        from mcp import StdioServerParameters, ClientSession
-        from mcp.client.stdio import stdio_client
-
-        server_params = StdioServerParameters(
-            command="uv",
-            args=[
-                "--directory",
-                str(PROJECT_ROOT),
-                "run",
-                "python",
-                "-m",
-                "mcp_read_only_sql.server",
-                "--config-dir",
-                str(Path(multi_server_config_file).parent),
-            ],
-        )
+        """Client for multi-server connection, shared by the class's read-only tests"""
+        server_params = stdio_server_params(multi_server_config_file)
 
         async with stdio_client(server_params) as (read, write):
             async with ClientSession(read, write) as session:
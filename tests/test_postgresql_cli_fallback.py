@@ -1,47 +1,11 @@
-import asyncio
-
 import pytest
 
 from mcp_read_only_sql.connectors.postgresql.cli import PostgreSQLCLIConnector
-
-
-class DummyStdout:
-    def __init__(self, lines):
-        self._lines = [line.encode() for line in lines]
-
-    async def readline(self):
-        if self._lines:
-            return self._lines.pop(0)
-        return b""
-
-
-class DummyStderr:
-    def __init__(self, data=b""):
-        self._data = data
-        self._read = False
-
-    async def read(self):
-        if self._read:
-            return b""
-        self._read = True
-        return self._data
-
-
-class DummyProcess:
-    def __init__(self, lines, returncode=0, stderr=b""):
-        self.stdout = DummyStdout(lines)
-        self.stderr = DummyStderr(stderr)
-        self.returncode = returncode
-
-    def kill(self):
-        pass
-
-    async def wait(self):
-        return self.returncode
+from tests.conftest import DummyProcess
 
 
 @pytest.mark.anyio
-async def test_postgres_cli_retries_without_pgoptions(monkeypatch):
+async def test_postgres_cli_retries_without_pgoptions(fake_subprocess):
     from tests.conftest import make_connection
 
     config = make_connection(
@@ -58,17 +22,14 @@ async def test_postgres_cli_retries_without_pgoptions(monkeypatch):
 
     connector = PostgreSQLCLIConnector(config)
 
-    call_log = []
-
-    async def fake_create_subprocess_exec(*cmd, stdout=None, stderr=None, env=None):
-        call_log.append(env.copy())
-        if len(call_log) == 1:
-            raise RuntimeError(
+    call_log = fake_subprocess(
+        [
+            RuntimeError(
                 "psql: unsupported startup parameter in options: default_transaction_read_only"
-            )
-        return DummyProcess(["column", "value"], returncode=0)
-
-    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_create_subprocess_exec)
+            ),
+            DummyProcess(["column", "value"], returncode=0),
+        ]
+    )
 
     result = await connector.execute_query("SELECT version()")
 
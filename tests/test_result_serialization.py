@@ -11,20 +11,16 @@ from mcp_read_only_sql.connectors.clickhouse.python import ClickHousePythonConne
 from mcp_read_only_sql.connectors.clickhouse.cli import ClickHouseCLIConnector
 from tests.docker_test_config import docker_test_server
 
+_NULL_REPRS = frozenset({"", "\\N", "NULL"})
+_BOOL_REPRS = frozenset({"t", "true", "True"})  # PostgreSQL true
+_CH_BOOL_REPRS = frozenset({"1", "true", "True"})  # ClickHouse true
+
 
 def parse_tsv(tsv_str):
     """Parse TSV string into columns and rows"""
-    # Only strip trailing newlines, not tabs!
-    lines = tsv_str.rstrip("\n").split("\n")
-    if not lines:
-        return [], []
-
-    columns = lines[0].split("\t")
-    rows = []
-    for line in lines[1:]:
-        if line:  # Skip empty lines
-            rows.append(line.split("\t"))
-    return columns, rows
+    # Split on "\n" only: splitlines() would also break rows on \r, \x0b, \u2028...
+    header, *lines = tsv_str.split("\n")
+    return header.split("\t"), [line.split("\t") for line in lines if line]
 
 
 @pytest.fixture
@@ -129,8 +125,8 @@ class TestPostgreSQLSerialization:
         assert row[0] == "1"
         assert row[1] == "1.5"
         assert row[2] == "test"
-        assert row[3] in ["t", "true", "True"]  # PostgreSQL boolean representations
-        assert row[4] in ["", "\\N", "NULL"]  # NULL representations
+        assert row[3] in _BOOL_REPRS  # PostgreSQL boolean representations
+        assert row[4] in _NULL_REPRS  # NULL representations
 
     async def test_datetime_serialization(self, postgres_python_conn):
         """Test that datetime values are returned in TSV"""
@@ -296,7 +292,7 @@ class TestClickHouseSerialization:
         assert row[1] == "-1"  # int_val
         assert row[2] == "1.5"  # float_val
         assert row[3] == "test"  # string_val
-        assert row[4] in ["1", "true", "True"]  # bool_val
+        assert row[4] in _CH_BOOL_REPRS  # bool_val
 
     async def test_datetime_types(self, clickhouse_python_conn):
         """Test ClickHouse datetime types in TSV"""
@@ -478,10 +474,10 @@ class TestEdgeCaseSerialization:
         row = rows[0]
 
         # NULLs in TSV are represented as empty strings or \N
-        assert row[0] in ["", "\\N", "NULL"]  # col1
-        assert row[1] in ["", "\\N", "NULL"]  # col2
+        assert row[0] in _NULL_REPRS  # col1
+        assert row[1] in _NULL_REPRS  # col2
         assert row[2] == "value"  # col3
-        assert row[3] in ["", "\\N", "NULL"]  # col4
+        assert row[3] in _NULL_REPRS  # col4
 
 
 @pytest.mark.integration
@@ -11,6 +11,7 @@ from mcp_read_only_sql.config.parser import ConfigParser
 from mcp_read_only_sql.connectors.postgresql.python import PostgreSQLPythonConnector
 from mcp_read_only_sql.connectors.clickhouse.python import ClickHousePythonConnector
 from mcp_read_only_sql.utils.sql_guard import ReadOnlyQueryError
+from tests.conftest import first_data_cell, tsv_line_count
 from tests.docker_test_config import apply_docker_test_overrides
 
 
@@ -132,17 +133,13 @@ class TestReadOnlySession:
             "SELECT COUNT(*) as count FROM users"
         )
         assert isinstance(result, str)
-        lines = result.strip().split("\n")
-        assert len(lines) >= 2  # Header + at least one row
-        row_values = lines[1].split("\t")
-        assert int(row_values[0]) > 0  # count > 0
+        assert tsv_line_count(result) >= 2  # Header + at least one row
+        assert int(first_data_cell(result)) > 0  # count > 0
 
         # ClickHouse
         result = await clickhouse_connector.execute_query(
             "SELECT COUNT(*) as count FROM testdb.events"
         )
         assert isinstance(result, str)
-        lines = result.strip().split("\n")
-        assert len(lines) >= 2  # Header + at least one row
-        row_values = lines[1].split("\t")
-        assert int(row_values[0]) > 0  # count > 0
+        assert tsv_line_count(result) >= 2  # Header + at least one row
+        assert int(first_data_cell(result)) > 0  # count > 0
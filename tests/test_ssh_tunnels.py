@@ -12,7 +12,7 @@ import paramiko
 from mcp_read_only_sql.connectors.postgresql.python import PostgreSQLPythonConnector
 from mcp_read_only_sql.connectors.clickhouse.python import ClickHousePythonConnector
 from mcp_read_only_sql.utils.ssh_tunnel import SSHTunnel
-from conftest import make_connection
+from conftest import first_data_cell, make_connection
 from tests.docker_test_config import (
     docker_test_server,
     docker_test_ssh_tunnel,
@@ -100,14 +100,12 @@ class TestSSHTunnelConnectivity:
         result = await connector.execute_query("SELECT 1 as test")
 
         assert isinstance(result, str), "Should return TSV string"
-        lines = result.strip().split("\n")
-        assert lines[1].split("\t")[0] == "1"
+        assert first_data_cell(result) == "1"
 
         # Verify we can query actual data
         result = await connector.execute_query("SELECT COUNT(*) as count FROM users")
         assert isinstance(result, str)
-        lines = result.strip().split("\n")
-        assert int(lines[1].split("\t")[0]) > 0
+        assert int(first_data_cell(result)) > 0
 
     async def test_postgres_ssh_key_auth(self, postgres_ssh_key_config):
         """Test PostgreSQL connection through SSH tunnel with key authentication"""
@@ -116,8 +114,7 @@ class TestSSHTunnelConnectivity:
         result = await connector.execute_query("SELECT 2 as test")
 
         assert isinstance(result, str), "Should return TSV string"
-        lines = result.strip().split("\n")
-        assert lines[1].split("\t")[0] == "2"
+        assert first_data_cell(result) == "2"
 
     async def test_clickhouse_ssh_tunnel(self, clickhouse_ssh_config):
         """Test ClickHouse connection through SSH tunnel"""
@@ -126,16 +123,14 @@ class TestSSHTunnelConnectivity:
         result = await connector.execute_query("SELECT 3 as test")
 
         assert isinstance(result, str), "Should return TSV string"
-        lines = result.strip().split("\n")
-        assert lines[1].split("\t")[0] == "3"
+        assert first_data_cell(result) == "3"
 
         # Verify we can query actual data
         result = await connector.execute_query(
             "SELECT COUNT(*) as count FROM testdb.events"
         )
         assert isinstance(result, str)
-        lines = result.strip().split("\n")
-        assert int(lines[1].split("\t")[0]) > 0
+        assert int(first_data_cell(result)) > 0
 
     async def test_ssh_tunnel_with_wrong_password(self):
         """Test that SSH connection fails gracefully with wrong password"""
@@ -0,0 +1,83 @@
+"""Unit tests for the TSV formatting helpers."""
+
+from mcp_read_only_sql.utils.tsv_formatter import (
+    format_as_tsv,
+    format_tsv_line,
+)
+
+
+class TestFormatAsTsv:
+    """format_as_tsv renders every supported row shape consistently"""
+
+    def test_empty_result(self):
+        assert format_as_tsv([], []) == ""
+
+    def test_header_only(self):
+        assert format_as_tsv([], ["id", "name"]) == "id\tname"
+
+    def test_dict_rows_follow_column_order(self):
+        rows = [{"name": "alice", "id": 1}, {"id": 2, "name": None}]
+
+        assert format_as_tsv(rows, ["id", "name"]) == "id\tname\n1\talice\n2\t"
+
+    def test_dict_rows_missing_column_render_empty(self):
+        rows = [{"id": 1}]
+
+        assert format_as_tsv(rows, ["id", "name"]) == "id\tname\n1\t"
+
+    def test_dict_rows_without_columns_use_row_values(self):
+        rows = [{"id": 1, "name": "alice"}]
+
+        assert format_as_tsv(rows, []) == "1\talice"
+
+    def test_tuple_and_list_rows(self):
+        assert format_as_tsv([(1, "a"), (2, None)], ["id", "v"]) == "id\tv\n1\ta\n2\t"
+        assert format_as_tsv([[1, "a"]], ["id", "v"]) == "id\tv\n1\ta"
+
+    def test_mixed_row_kinds(self):
+        rows = [{"x": 1}, ("a",), ["b"], None]
+
+        assert format_as_tsv(rows, ["x"]) == 'x\n1\na\nb\n""'
+
+    def test_string_rows(self):
+        rows = [("1", "a\tb"), ("2", None), ("3", "c")]
+
+        assert format_as_tsv(rows, ["id", "v"]) == 'id\tv\n1\t"a\tb"\n2\t\n3\tc'
+
+    def test_trailing_empty_rows_are_trimmed(self):
+        assert format_as_tsv([(1,), ()], ["n"]) == "n\n1"
+
+    def test_string_first_row_with_mixed_rows(self):
+        rows = [("a",), {"x": 1}, 2]
+
+        assert format_as_tsv(rows, ["x"]) == "x\na\n1\n2"
+
+    def test_scalar_rows(self):
+        assert format_as_tsv([1, 2], ["n"]) == "n\n1\n2"
+
+    def test_special_characters_are_quoted(self):
+        rows = [("tab\there", 'say "hi"', "multi\nline")]
+
+        assert (
+            format_as_tsv(rows, ["a", "b", "c"])
+            == 'a\tb\tc\n"tab\there"\t"say ""hi"""\t"multi\nline"'
+        )
+
+    def test_ragged_rows_keep_their_width(self):
+        rows = [(i,) if i % 2 else (i, "x") for i in range(200)]
+
+        assert format_as_tsv(rows, []).split("\n")[:3] == ["0\tx", "1", "2\tx"]
+
+
+class TestFormatTsvLine:
+    """format_tsv_line renders a single row without a trailing newline"""
+
+    def test_plain_values(self):
+        assert format_tsv_line([1, "a", None, 2.5]) == "1\ta\t\t2.5"
+
+    def test_special_characters_are_quoted(self):
+        assert format_tsv_line(["a\tb", 'q"']) == '"a\tb"\t"q"""'
+
+    def test_single_empty_value_is_quoted(self):
+        assert format_tsv_line([None]) == '""'
+        assert format_tsv_line([None, None]) == "\t"